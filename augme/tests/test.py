@@ -1,5 +1,6 @@
 import os 
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import augme.video as amv
 import json
@@ -12,6 +13,21 @@ def select_random_audio(audio_path, rng=np.random.default_rng()):
     return str(audio)
 
 
+def uniform(u, low, high):
+    return low + u * (high - low)
+
+
+def integer(u, low, high):
+    return int(low + u * (high - low))
+
+
+def run_augmentation(augment_method, *args, **kwargs):
+    meta_list = []
+    augment_method(*args, metadata=meta_list, **kwargs)
+
+    return meta_list
+
+
 def get_font_path():
     # ffmpeg only accepts posix-style relative directory of fontfile
     working_directory = os.path.dirname(__file__)
@@ -33,49 +49,67 @@ audio_dir = "audio"
 seed = 123456
 rng = np.random.default_rng(seed)
 
+# FFMPEG runs are independent, so run several at once and split the cores
+# between them to avoid oversubscription
+max_workers = min(os.cpu_count() or 1, 8)
+os.environ["AUGME_THREADS"] = str(max(1, (os.cpu_count() or 1) // max_workers))
+pool = ThreadPoolExecutor(max_workers=max_workers)
+
+
+def submit(augment_method, *args, **kwargs):
+    return pool.submit(run_augmentation, augment_method, *args, **kwargs)
+
+
 # Random parameters for video augmentation
 font_path = get_font_path()
-noise_level = rng.integers(20000, 1000000)
 audio_path = select_random_audio(audio_dir, rng=rng)
-blend_opacity = rng.uniform(0.2, 0.8)
-blur_sigma = rng.uniform(1, 10)
-brightness_level = rng.uniform(-0.6, 0.6)
-aspect_ratio = rng.uniform(9/16, 16/9)
-speed_factor = rng.uniform(0.5, 2)
-saturation_factor = rng.uniform(0.0, 3.0)
-pad_color = (rng.integers(0, 255), rng.integers(0, 255), rng.integers(0, 255))
-contrast_level = rng.uniform(-2.0, 2.0)
-crop_left = rng.uniform(0, 0.3)
-crop_top = rng.uniform(0, 0.3)
-crop_right = rng.uniform(0.7, 1.0)
-crop_bottom = rng.uniform(0.7, 1.0)
-encoding_quality = rng.integers(17, 51)
-fps = rng.integers(1, 30)
-num_loops = rng.integers(1, 5)
-overlay_size = rng.uniform(0.3, 0.8)
-overlay_x = rng.uniform(0, 1 - overlay_size)
-overlay_y = rng.uniform(0, 1 - overlay_size)
 emoji_path = amv.helpers.select_random_emoji(rng=rng)
-emoji_x = rng.uniform(0.1, 0.6)
-emoji_y = rng.uniform(0.1, 0.6)
-emoji_opacity = rng.uniform(0.5, 1.0)
-emoji_size = rng.uniform(0.2, 0.6)
-text_lines = rng.integers(4, 10)
-text_fontsize = rng.uniform(0.05, 1/text_lines)
-text_opacity = rng.uniform(0.5, 1.0)
-pad_width = rng.uniform(0, 0.25)
-pad_height = rng.uniform(0, 0.25)
-pixelization_factor = rng.uniform(0.1, 0.5)
-frames_cache = rng.integers(5, 30)
-resize_width = rng.integers(320, 1920)
-resize_height = rng.integers(320, 1920)
-rotate_degrees = rng.choice([i for i in range(-30, 30, 5)])
-scale_factor = rng.uniform(0.2, 0.8)
-stack_2grid = rng.choice([0, 1])
-stack_pad = rng.choice([True, False])
-stack_preserve_aspect_ratio = rng.choice([True, False])
-stack_4grid = rng.choice([0, 1, 2, 3])
-transpose_direction = rng.choice([0, 1, 2, 3])
+
+# draw every continuous parameter at once and map it onto its range
+u = iter(rng.random(35))
+noise_level = integer(next(u), 20000, 1000000)
+blend_opacity = uniform(next(u), 0.2, 0.8)
+blur_sigma = uniform(next(u), 1, 10)
+brightness_level = uniform(next(u), -0.6, 0.6)
+aspect_ratio = uniform(next(u), 9/16, 16/9)
+speed_factor = uniform(next(u), 0.5, 2)
+saturation_factor = uniform(next(u), 0.0, 3.0)
+pad_color = tuple(integer(next(u), 0, 255) for _ in range(3))
+contrast_level = uniform(next(u), -2.0, 2.0)
+crop_left = uniform(next(u), 0, 0.3)
+crop_top = uniform(next(u), 0, 0.3)
+crop_right = uniform(next(u), 0.7, 1.0)
+crop_bottom = uniform(next(u), 0.7, 1.0)
+encoding_quality = integer(next(u), 17, 51)
+fps = integer(next(u), 1, 30)
+num_loops = integer(next(u), 1, 5)
+overlay_size = uniform(next(u), 0.3, 0.8)
+overlay_x = uniform(next(u), 0, 1 - overlay_size)
+overlay_y = uniform(next(u), 0, 1 - overlay_size)
+emoji_x = uniform(next(u), 0.1, 0.6)
+emoji_y = uniform(next(u), 0.1, 0.6)
+emoji_opacity = uniform(next(u), 0.5, 1.0)
+emoji_size = uniform(next(u), 0.2, 0.6)
+text_lines = integer(next(u), 4, 10)
+text_fontsize = uniform(next(u), 0.05, 1/text_lines)
+text_opacity = uniform(next(u), 0.5, 1.0)
+pad_width = uniform(next(u), 0, 0.25)
+pad_height = uniform(next(u), 0, 0.25)
+pixelization_factor = uniform(next(u), 0.1, 0.5)
+frames_cache = integer(next(u), 5, 30)
+resize_width = integer(next(u), 320, 1920)
+resize_height = integer(next(u), 320, 1920)
+scale_factor = uniform(next(u), 0.2, 0.8)
+
+# and every discrete choice with a single draw
+rotate_choices = list(range(-30, 30, 5))
+choices = rng.integers(0, [len(rotate_choices), 2, 2, 2, 4, 4])
+rotate_degrees = rotate_choices[choices[0]]
+stack_2grid = int(choices[1])
+stack_pad = bool(choices[2])
+stack_preserve_aspect_ratio = bool(choices[3])
+stack_4grid = int(choices[4])
+transpose_direction = int(choices[5])
 
 # Transforms API
 augment_methods = [
@@ -145,116 +179,183 @@ augment_methods = [
     ),
 ]
 
-for i in range(len(augment_methods)):
-    meta_list = []
-    output_path = f"output_transform/video_{str(i+1).zfill(2)}.mp4"
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    augment_methods[i](video1, output_path, metadata=meta_list)
+Path("output_transform").mkdir(parents=True, exist_ok=True)
+transform_jobs = [
+    submit(augment_methods[i], video1,
+        f"output_transform/video_{str(i+1).zfill(2)}.mp4")
+    for i in range(len(augment_methods))
+]
+
+transform_meta = {
+    f"output_transform/video_{str(i+1).zfill(2)}.mp4": transform_jobs[i].result()
+    for i in range(len(transform_jobs))
+}
+
+with open(f"output_transform/metadata.json", "w") as f:
+    json.dump(transform_meta, f)
 
-    with open(f"output_transform/video_{str(i+1).zfill(2)}.json", "w") as f:
-        json.dump(meta_list, f)
-        
 
 # Functional API
-meta_list = []
 Path("output_functional").mkdir(parents=True, exist_ok=True)
+functional_jobs = []
 
-amv.add_noise(video1, output_path="output_functional/video_01.mp4",
-    level=noise_level, add_audio_noise=True, metadata=meta_list)
-amv.audio_swap(video1, audio_path, output_path="output_functional/video_02.mp4",
-    audio_offset=0, metadata=meta_list)
-amv.blend_videos(video1, video2, output_path="output_functional/video_03.mp4",
-    opacity=blend_opacity, merge_audio=True, metadata=meta_list)
-amv.blur(video1, output_path="output_functional/video_04.mp4", sigma=blur_sigma,
-    metadata=meta_list)
-amv.brightness(video1, output_path="output_functional/video_05.mp4",
-    level=brightness_level, metadata=meta_list)
-amv.change_aspect_ratio(video1, output_path="output_functional/video_06.mp4",
-    ratio=aspect_ratio, metadata=meta_list)
-amv.change_video_speed(video1, output_path="output_functional/video_07.mp4",
-    factor=speed_factor, metadata=meta_list)
-amv.color_jitter(video1, output_path="output_functional/video_08.mp4",
-    saturation_factor=saturation_factor, metadata=meta_list)
-amv.concat([video1, video2, video3, video4],
+functional_jobs.append(submit(amv.add_noise, video1,
+    output_path="output_functional/video_01.mp4",
+    level=noise_level, add_audio_noise=True))
+functional_jobs.append(submit(amv.audio_swap, video1, audio_path,
+    output_path="output_functional/video_02.mp4",
+    audio_offset=0))
+functional_jobs.append(submit(amv.blend_videos, video1, video2,
+    output_path="output_functional/video_03.mp4",
+    opacity=blend_opacity, merge_audio=True))
+functional_jobs.append(submit(amv.blur, video1,
+    output_path="output_functional/video_04.mp4", sigma=blur_sigma))
+functional_jobs.append(submit(amv.brightness, video1,
+    output_path="output_functional/video_05.mp4",
+    level=brightness_level))
+functional_jobs.append(submit(amv.change_aspect_ratio, video1,
+    output_path="output_functional/video_06.mp4",
+    ratio=aspect_ratio))
+functional_jobs.append(submit(amv.change_video_speed, video1,
+    output_path="output_functional/video_07.mp4",
+    factor=speed_factor))
+functional_jobs.append(submit(amv.color_jitter, video1,
+    output_path="output_functional/video_08.mp4",
+    saturation_factor=saturation_factor))
+functional_jobs.append(submit(amv.concat, [video1, video2, video3, video4],
     output_path="output_functional/video_09.mp4",
-    src_video_path_index=1, pad_color=pad_color, metadata=meta_list)
-amv.contrast(video1, output_path="output_functional/video_10.mp4",
-    level=contrast_level, metadata=meta_list)
-amv.crop(video1, output_path="output_functional/video_11.mp4", left=crop_left,
-    top=crop_top, right=crop_right, bottom=crop_bottom, metadata=meta_list)
-amv.emboss(video1, output_path="output_functional/video_12.mp4",
-    metadata=meta_list)
-amv.encoding_quality(video1, output_path="output_functional/video_13.mp4",
-    quality=encoding_quality, metadata=meta_list)
-amv.fps(video1, output_path="output_functional/video_14.mp4", fps=fps,
-    metadata=meta_list)
-amv.gradient(video1, output_path="output_functional/video_15.mp4",
-    metadata=meta_list)
-amv.grayscale(video1, output_path="output_functional/video_16.mp4",
-    metadata=meta_list)
-amv.hflip(video1, output_path="output_functional/video_17.mp4",
-    metadata=meta_list)
-amv.insert_in_background(video1, video2,
+    src_video_path_index=1, pad_color=pad_color))
+functional_jobs.append(submit(amv.contrast, video1,
+    output_path="output_functional/video_10.mp4",
+    level=contrast_level))
+functional_jobs.append(submit(amv.crop, video1,
+    output_path="output_functional/video_11.mp4", left=crop_left,
+    top=crop_top, right=crop_right, bottom=crop_bottom))
+functional_jobs.append(submit(amv.emboss, video1,
+    output_path="output_functional/video_12.mp4"))
+functional_jobs.append(submit(amv.encoding_quality, video1,
+    output_path="output_functional/video_13.mp4",
+    quality=encoding_quality))
+functional_jobs.append(submit(amv.fps, video1,
+    output_path="output_functional/video_14.mp4", fps=fps))
+functional_jobs.append(submit(amv.gradient, video1,
+    output_path="output_functional/video_15.mp4"))
+functional_jobs.append(submit(amv.grayscale, video1,
+    output_path="output_functional/video_16.mp4"))
+functional_jobs.append(submit(amv.hflip, video1,
+    output_path="output_functional/video_17.mp4"))
+functional_jobs.append(submit(amv.insert_in_background, video1, video2,
     output_path="output_functional/video_18.mp4", start=5, end=15,
-    background_offset=10, pad_color=pad_color, metadata=meta_list)
-amv.loop(video1, output_path="output_functional/video_19.mp4",
-    num_loops=num_loops, metadata=meta_list)
-amv.overlay(video1, video2, output_path="output_functional/video_20.mp4",
+    background_offset=10, pad_color=pad_color))
+functional_jobs.append(submit(amv.loop, video1,
+    output_path="output_functional/video_19.mp4",
+    num_loops=num_loops))
+functional_jobs.append(submit(amv.overlay, video1, video2,
+    output_path="output_functional/video_20.mp4",
     overlay_size=overlay_size, x_factor=overlay_x, y_factor=overlay_y,
-    merge_audio=True, metadata=meta_list)
-amv.overlay_emoji(video1, output_path="output_functional/video_21.mp4",
+    merge_audio=True))
+functional_jobs.append(submit(amv.overlay_emoji, video1,
+    output_path="output_functional/video_21.mp4",
     emoji_path=emoji_path, x_factor=emoji_x, y_factor=emoji_y, opacity=emoji_opacity,
-    emoji_size=emoji_size, metadata=meta_list)
-amv.overlay_text(video1, output_path="output_functional/video_22.mp4",
+    emoji_size=emoji_size))
+functional_jobs.append(submit(amv.overlay_text, video1,
+    output_path="output_functional/video_22.mp4",
     font=font_path, fontsize=text_fontsize, num_lines=text_lines,
-    opacity=text_opacity, metadata=meta_list)
-amv.pad(video1, output_path="output_functional/video_23.mp4",
-    w_factor=pad_width, h_factor=pad_height, color=pad_color, metadata=meta_list)
-amv.pixelization(video1, output_path="output_functional/video_24.mp4",
-    ratio=pixelization_factor, metadata=meta_list)
-amv.random_frames(video1, output_path="output_functional/video_25.mp4",
-    num_frames=frames_cache, metadata=meta_list)
-amv.remove_audio(video1, output_path="output_functional/video_26.mp4",
-    metadata=meta_list)
-amv.resize(video1, output_path="output_functional/video_27.mp4",
-    width=resize_width, height=resize_height, metadata=meta_list)
-amv.rotate(video1, output_path="output_functional/video_28.mp4",
-    degrees=rotate_degrees, metadata=meta_list)
-amv.scale(video1, output_path="output_functional/video_29.mp4",
-    factor=scale_factor, metadata=meta_list)
-amv.transpose(video1, output_path="output_functional/video_30.mp4",
-    direction=transpose_direction, metadata=meta_list)
-amv.trim(video1, output_path="output_functional/video_31.mp4", start=5, end=17,
-    metadata=meta_list)
-amv.vflip(video1, output_path="output_functional/video_32.mp4",
-    metadata=meta_list)
-amv.vstack(video1, video2,
+    opacity=text_opacity))
+functional_jobs.append(submit(amv.pad, video1,
+    output_path="output_functional/video_23.mp4",
+    w_factor=pad_width, h_factor=pad_height, color=pad_color))
+functional_jobs.append(submit(amv.pixelization, video1,
+    output_path="output_functional/video_24.mp4",
+    ratio=pixelization_factor))
+functional_jobs.append(submit(amv.random_frames, video1,
+    output_path="output_functional/video_25.mp4",
+    num_frames=frames_cache))
+functional_jobs.append(submit(amv.remove_audio, video1,
+    output_path="output_functional/video_26.mp4"))
+functional_jobs.append(submit(amv.resize, video1,
+    output_path="output_functional/video_27.mp4",
+    width=resize_width, height=resize_height))
+functional_jobs.append(submit(amv.rotate, video1,
+    output_path="output_functional/video_28.mp4",
+    degrees=rotate_degrees))
+functional_jobs.append(submit(amv.scale, video1,
+    output_path="output_functional/video_29.mp4",
+    factor=scale_factor))
+functional_jobs.append(submit(amv.transpose, video1,
+    output_path="output_functional/video_30.mp4",
+    direction=transpose_direction))
+functional_jobs.append(submit(amv.trim, video1,
+    output_path="output_functional/video_31.mp4", start=5, end=17))
+functional_jobs.append(submit(amv.vflip, video1,
+    output_path="output_functional/video_32.mp4"))
+functional_jobs.append(submit(amv.vstack, video1, video2,
     output_path="output_functional/video_33.mp4",
     merge_audio=True,
     target_grid=stack_2grid,
     preserve_aspect_ratio=stack_preserve_aspect_ratio,
     pad_second_video=stack_pad,
-    pad_color=pad_color,
-    metadata=meta_list
-)
-amv.hstack(video1, video2,
+    pad_color=pad_color
+))
+functional_jobs.append(submit(amv.hstack, video1, video2,
     output_path="output_functional/video_34.mp4",
     merge_audio=True,
     target_grid=stack_2grid,
     preserve_aspect_ratio=stack_preserve_aspect_ratio,
     pad_second_video=stack_pad,
-    pad_color=pad_color,
-    metadata=meta_list
-)
-amv.fstack(video1, video2, video3, video4,
+    pad_color=pad_color
+))
+functional_jobs.append(submit(amv.fstack, video1, video2, video3, video4,
     output_path="output_functional/video_35.mp4",
     merge_audio=True,
     target_grid=stack_4grid,
     preserve_aspect_ratio=stack_preserve_aspect_ratio,
     pad_video=stack_pad,
-    pad_color=pad_color,
-    metadata=meta_list
-)
+    pad_color=pad_color
+))
 
+meta_list = [meta for job in functional_jobs for meta in job.result()]
+pool.shutdown()
 with open(f"output_functional/metadata.json", "w") as f:
         json.dump(meta_list, f)
+
+
+# Batch API
+# filter-only augmentations decode video1 once and share a single FFMPEG run,
+# the remaining augmenters fall back to one FFMPEG run each
+batch_augmenters = [
+    amv.ffmpeg.VideoAugmenterByBlur(sigma=blur_sigma),
+    amv.ffmpeg.VideoAugmenterByBrightness(level=brightness_level),
+    amv.ffmpeg.VideoAugmenterByAspectRatio(ratio=aspect_ratio),
+    amv.ffmpeg.VideoAugmenterByColorJitter(brightness_factor=0,
+        contrast_factor=1, saturation_factor=saturation_factor),
+    amv.ffmpeg.VideoAugmenterByContrast(level=contrast_level),
+    amv.ffmpeg.VideoAugmenterByCrop(left=crop_left, top=crop_top,
+        right=crop_right, bottom=crop_bottom),
+    amv.ffmpeg.VideoAugmenterByEmboss(),
+    amv.ffmpeg.VideoAugmenterByFPSChange(fps=fps),
+    amv.ffmpeg.VideoAugmenterByGradient(),
+    amv.ffmpeg.VideoAugmenterByGrayscale(),
+    amv.ffmpeg.VideoAugmenterByHFlip(),
+    amv.ffmpeg.VideoAugmenterByText(font=font_path, fontsize=text_fontsize,
+        num_lines=text_lines, opacity=text_opacity),
+    amv.ffmpeg.VideoAugmenterByPadding(w_factor=pad_width, h_factor=pad_height,
+        color=pad_color),
+    amv.ffmpeg.VideoAugmenterByRandomFrames(num_frames=frames_cache),
+    amv.ffmpeg.VideoAugmenterByResize(width=resize_width, height=resize_height),
+    amv.ffmpeg.VideoAugmenterByRotation(degrees=rotate_degrees),
+    amv.ffmpeg.VideoAugmenterByResolution(factor=scale_factor),
+    amv.ffmpeg.VideoAugmenterByTransposition(direction=transpose_direction),
+    amv.ffmpeg.VideoAugmenterByVFlip(),
+]
+
+meta_list = []
+Path("output_batch").mkdir(parents=True, exist_ok=True)
+batch_outputs = [
+    f"output_batch/video_{str(i+1).zfill(2)}.mp4"
+    for i in range(len(batch_augmenters))
+]
+amv.batch_apply(video1, batch_augmenters, batch_outputs, metadata=meta_list)
+
+with open(f"output_batch/metadata.json", "w") as f:
+        json.dump(meta_list, f)
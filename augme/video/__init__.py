@@ -2,15 +2,19 @@ from augme.video.functional import (
     add_noise,
     add_silent_audio,
     audio_swap,
+    batch_apply,
     blur,
     brightness,
     change_aspect_ratio,
     change_video_speed,
+    chain,
     color_jitter,
+    compose,
     concat,
     contrast,
     crop,
     encoding_quality,
+    eq,
     fps,
     grayscale,
     hflip,
@@ -38,6 +42,9 @@ from augme.video.functional import (
 )
 
 
+from augme.video.helpers import finalize_metadata
+
+
 from augme.video.transforms import (
     AddNoise,
     AddSilentAudio,
@@ -48,11 +55,13 @@ from augme.video.transforms import (
     ChangeAspectRatio,
     ChangeVideoSpeed,
     ColorJitter,
+    Compose,
     Concat,
     Contrast,
     Crop,
     Emboss,
     EncodingQuality,
+    Eq,
     FPS,
     FStack,
     Gradient,
@@ -83,17 +92,21 @@ __all__ = [
     "add_noise",
     "add_silent_audio",
     "audio_swap",
+    "batch_apply",
     "blend_videos",
     "blur",
     "brightness",
     "change_aspect_ratio",
     "change_video_speed",
+    "chain",
     "color_jitter",
+    "compose",
     "concat",
     "contrast",
     "crop",
     "emboss",
     "encoding_quality",
+    "eq",
     "fps",
     "fstack",
     "gradient",
@@ -126,11 +139,13 @@ __all__ = [
     "ChangeAspectRatio",
     "ChangeVideoSpeed",
     "ColorJitter",
+    "Compose",
     "Concat",
     "Contrast",
     "Crop",
     "Emboss",
     "EncodingQuality",
+    "Eq",
     "FPS",
     "FStack",
     "Gradient",
@@ -153,4 +168,6 @@ __all__ = [
     "Trim",
     "VFlip",
     "VStack",
+    # --helpers--
+    "finalize_metadata",
 ]
\ No newline at end of file
@@ -9,6 +9,7 @@ from augme.video.ffmpeg.concat import VideoAugmenterByConcat
 from augme.video.ffmpeg.contrast import VideoAugmenterByContrast
 from augme.video.ffmpeg.crop import VideoAugmenterByCrop
 from augme.video.ffmpeg.emboss import VideoAugmenterByEmboss
+from augme.video.ffmpeg.eq import VideoAugmenterByEq
 from augme.video.ffmpeg.fps import VideoAugmenterByFPSChange
 from augme.video.ffmpeg.fstack import VideoAugmenterByFStack
 from augme.video.ffmpeg.gradient import VideoAugmenterByGradient
@@ -20,6 +21,7 @@ from augme.video.ffmpeg.no_audio import VideoAugmenterByRemovingAudio
 from augme.video.ffmpeg.noise import VideoAugmenterByNoise
 from augme.video.ffmpeg.overlay import VideoAugmenterByOverlay
 from augme.video.ffmpeg.pad import VideoAugmenterByPadding
+from augme.video.ffmpeg.pipeline import VideoAugmenterPipeline
 from augme.video.ffmpeg.quality import VideoAugmenterByQuality
 from augme.video.ffmpeg.random_frames import VideoAugmenterByRandomFrames
 from augme.video.ffmpeg.resize import VideoAugmenterByResize
@@ -45,6 +47,7 @@ __all__ = [
     "VideoAugmenterByContrast",
     "VideoAugmenterByCrop",
     "VideoAugmenterByEmboss",
+    "VideoAugmenterByEq",
     "VideoAugmenterByFPSChange",
     "VideoAugmenterByFStack",
     "VideoAugmenterByGradient",
@@ -67,4 +70,5 @@ __all__ = [
     "VideoAugmenterByTrim",
     "VideoAugmenterByVFlip",
     "VideoAugmenterByVStack",
+    "VideoAugmenterPipeline",
 ]
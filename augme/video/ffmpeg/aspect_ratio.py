@@ -1,14 +1,38 @@
-from math import ceil, sqrt
+from math import sqrt
 from typing import List
 from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
 from augme.video.helpers import get_video_info
 
 
 class VideoAugmenterByAspectRatio(BaseFFMPEGAugmenter):
+    changes_size = True
+
     def __init__(self, ratio: float):
         assert (ratio > 0), "Aspect ratio must be positive number"
         self.aspect_ratio = ratio
 
+    def get_filter_string(self, video_path: str) -> str:
+        """
+        Constructs the FFMPEG video filter chain that changes the sample (sar) &
+        display (dar) aspect ratios of the video
+
+        @param video_path: the path to the video to be augmented
+
+        @returns: a string containing the FFMPEG video filter chain for
+            the augmentation
+        """
+        video_info = get_video_info(video_path)
+        area = int(video_info["width"]) * int(video_info["height"])
+
+        # FFmpeg requires even dimensions; snapping them to the nearest
+        # multiple of 16 also matches the encoder's 16x16 macroblocks
+        new_w = max(16, (round(sqrt(area * self.aspect_ratio)) + 8) & ~15)
+        new_h = max(16, (round(area / new_w) + 8) & ~15)
+
+        return f"scale=width={new_w}:height={new_h}," \
+            + "setsar=ratio=1:1," \
+            + f"setdar=ratio={self.aspect_ratio}"
+
     def get_command(self, video_path: str, output_path: str) -> List[str]:
         """
         Changes the sample (sar) & display (dar) aspect ratios of the video
@@ -20,17 +44,8 @@ class VideoAugmenterByAspectRatio(BaseFFMPEGAugmenter):
         @returns: a list of strings containing the CLI FFMPEG command for
             the augmentation
         """
-        video_info = get_video_info(video_path)
-        area = int(video_info["width"]) * int(video_info["height"])
-
-        # FFmpeg requires even dimensions
-        new_w = ceil(int(sqrt(area * self.aspect_ratio)) / 2) * 2
-        new_h = ceil(int(area / new_w) / 2) * 2
-
         filters = [
-            "-vf",  f"scale=width={new_w}:height={new_h},"
-            + f"setsar=ratio=1:1,"
-            + f"setdar=ratio={self.aspect_ratio}",
+            "-vf",  self.get_filter_string(video_path),
             "-c:a", "copy",
         ]
 
@@ -6,6 +6,9 @@ from augme.video.helpers import (
     validate_path,
 )
 
+# audio codecs that can be muxed into the output container without re-encoding
+copy_audio_codecs = ("aac", "mp3")
+
 
 class VideoAugmenterByAudioSwap(BaseFFMPEGAugmenter):
     def __init__(self, audio_path: str, audio_offset: float):
@@ -35,19 +38,48 @@ class VideoAugmenterByAudioSwap(BaseFFMPEGAugmenter):
         start = self.audio_offset
         end = start + float(video_info["duration"])
 
-        audio_filters = f"atrim={start}:{end},asetpts=PTS-STARTPTS"
+        # the swapped audio is written as is when it covers the whole video
+        # and the container can hold its codec, otherwise it's trimmed, padded
+        # and re-encoded
+        if end <= audio_duration and audio_info.get("codec_name") in copy_audio_codecs:
+            audio_input = [
+                "-ss", str(start),
+                "-to", str(end),
+                "-i", self.audio_path,
+            ]
+            audio_filters = ["-c:a", "copy"]
+        else:
+            # seek in the demuxer rather than decoding and dropping the
+            # audio before the offset
+            audio_input = [
+                "-ss", str(start),
+                "-i", self.audio_path,
+            ]
+            audio_filter = f"atrim=0:{end - start},asetpts=PTS-STARTPTS"
+
+            if end > audio_duration:
+                pad_len = (end - audio_duration) * audio_sample_rate
+                audio_filter += f",apad=pad_len={pad_len}"
 
-        if end > audio_duration:
-            pad_len = (end - audio_duration) * audio_sample_rate
-            audio_filters += f",apad=pad_len={pad_len}"
+            audio_filters = ["-af", audio_filter, "-c:a", "aac"]
 
-        filters = [
-            "-i", self.audio_path,
-            "-vf", "pad=width=ceil(iw/2)*2:height=ceil(ih/2)*2",
-            "-af", audio_filters,
+        # the video stream is copied, unless its dimensions have to be padded
+        # to even numbers for the encoder
+        if video_info["width"] % 2 or video_info["height"] % 2:
+            video_filters = [
+                "-vf", "pad=width=ceil(iw/2)*2:height=ceil(ih/2)*2",
+                *audio_filters,
+            ]
+            output = self.output_fmt(output_path)
+        else:
+            video_filters = ["-c:v", "copy", *audio_filters]
+            output = self.container_fmt(output_path)
+
+        return [
+            *self.input_fmt(video_path),
+            *audio_input,
             "-map", "0:v:0",
             "-map", "1:a:0",
-            "-c:a", "aac",
+            *video_filters,
+            *output,
         ]
-
-        return self.standard_filter_fmt(video_path, filters, output_path)
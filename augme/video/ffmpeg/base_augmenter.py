@@ -1,21 +1,90 @@
+import atexit
 import os
-import shutil
+import subprocess
+import tempfile
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 from augme.video.helpers import (
     validate_input_and_output_paths,
-    CustomNamedTemporaryFile,
-    execute_ffmpeg_cmd
+    execute_ffmpeg_cmd,
+    execute_ffmpeg_cmd_async,
+    execute_ffmpeg_cmds,
+    get_filters,
+    get_hwaccels,
+    maybe_pad_even,
 )
 
 # use appropriate GPU encoder for acceleration
 # however, some encoding options may not be available
-encoders = {'cpu': 'libx264', 'amd': 'h264_amf', 'nvidia': 'h264_nvenc'}
+encoders = {
+    'cpu': 'libx264',
+    'amd': 'h264_amf',
+    'intel': 'h264_qsv',
+    'nvidia': 'h264_nvenc',
+}
+# augmentations generate training data, so favour encoding speed over
+# compression ratio
+presets = {'cpu': 'veryfast', 'amd': 'speed', 'intel': 'veryfast', 'nvidia': 'p4'}
+# hardware decoders matching the GPU encoders, only used if FFMPEG supports them
+hwaccels = {'intel': 'qsv', 'nvidia': 'cuda'}
+# encoder used when none is passed in; if left as None, it is read from the
+# AUGME_ENCODER environment variable and falls back to the cpu
+default_encoder = None
+# encoding settings used when none are passed in; if left as None, they are
+# read from the AUGME_PRESET, AUGME_TUNE and AUGME_CRF environment variables
+# and fall back to the encoder's preset in presets, no tune and a crf of 23.
+# Outputs that are decoded right away by a training loop can trade size and
+# quality for speed, e.g. with the "ultrafast" x264 preset
+default_preset = None
+default_tune = None
+default_crf = None
+# filter graphs longer than this many characters are passed to FFMPEG in a
+# script file, to keep the command well below the OS argument size limit
+script_threshold = 8192
+# the temporary files read by the commands built so far (e.g. filter scripts),
+# deleted once a command reading them has run. The commands may also be run
+# by the caller after they are built, so whatever is left is deleted at exit
+command_files = []
+# the options that read each kind of filter graph from a file
+script_options = {"-vf": "-filter_script:v", "-filter_complex": "-filter_complex_script"}
 # -init_hw_device cuda:0,primary_ctx=1
 
+@atexit.register
+def remove_command_files(cmd: Optional[List[str]] = None) -> None:
+    """
+    Deletes the temporary files read by an FFMPEG command, once it has run
+
+    @param cmd: the CLI FFMPEG command. If not passed in, every temporary
+        file written so far is deleted
+    """
+    if cmd is None:
+        paths = list(command_files)
+    else:
+        # the filter graphs moved to script files can read further files
+        text = " ".join(cmd)
+        for path in list(command_files):
+            if path.endswith(".txt") and path in text and os.path.exists(path):
+                with open(path, encoding="utf-8") as file:
+                    text += file.read()
+        paths = [path for path in command_files if os.path.basename(path) in text]
+
+    for path in paths:
+        if path in command_files:
+            command_files.remove(path)
+        if os.path.exists(path):
+            os.remove(path)
+
+
 class BaseFFMPEGAugmenter(ABC):
+    # whether the augmentation can read its input video from a pipe
+    pipeable = True
+    # whether the augmented video can have other dimensions than the input,
+    # so the augmentations after it must be configured from its output
+    changes_size = False
+
     def add_augmenter(self, video_path: str, output_path: Optional[str] = None, **kwargs
-    ) -> None:
+    ) -> Optional[subprocess.Popen]:
         """
         Applies the specific augmentation to the video
 
@@ -24,19 +93,85 @@ class BaseFFMPEGAugmenter(ABC):
         @param output_path: the path in which the resulting video will be stored.
             If not passed in, the original video file will be overwritten
 
-        @param kwargs: parameters for specific augmenters
+        @param kwargs: parameters for specific augmenters. `threads` caps the
+            number of threads FFMPEG uses, which is useful when several
+            augmentations run in parallel. If not passed in, the AUGME_THREADS
+            environment variable is used, otherwise FFMPEG picks the count.
+            If `async_` is set to True, FFMPEG is started without waiting for
+            it to finish; the output path must then differ from the video path
+
+        @returns: the handle of the running FFMPEG process if `async_` is set
+            to True, otherwise None. Overwriting the video raises a RuntimeError
+            if FFMPEG fails, leaving the video unchanged
         """
         video_path, output_path = validate_input_and_output_paths(
             video_path, output_path
         )
-        with CustomNamedTemporaryFile(
-            suffix=os.path.splitext(video_path)[1]
-        ) as tmpfile:
-            if video_path == output_path:
-                shutil.copyfile(video_path, tmpfile.name)
-                video_path = tmpfile.name
+        threads = kwargs.get("threads") or os.environ.get("AUGME_THREADS")
+        async_ = kwargs.get("async_", False)
 
-            execute_ffmpeg_cmd(self.get_command(video_path, output_path))
+        if video_path != output_path:
+            return self.run_command(video_path, output_path, threads, async_)
+
+        assert not async_, \
+            "Asynchronous augmentations can't overwrite the input video"
+
+        # write next to the input and swap the files once FFMPEG succeeded,
+        # so the input is never read and written at the same time
+        fd, tmp_path = tempfile.mkstemp(
+            suffix=os.path.splitext(output_path)[1],
+            prefix=".augme-",
+            dir=os.path.dirname(os.path.abspath(output_path)),
+        )
+        os.close(fd)
+        try:
+            returncode = self.run_command(video_path, tmp_path, threads)
+            if returncode:
+                raise RuntimeError(
+                    f"FFMPEG failed while applying {type(self).__name__} "
+                    + f"(return code {returncode}), {output_path} was left unchanged"
+                )
+            os.replace(tmp_path, output_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def run_command(
+        self,
+        video_path: str,
+        output_path: str,
+        threads: Optional[int] = None,
+        async_: bool = False,
+    ) -> Union[int, subprocess.Popen]:
+        """
+        Constructs and executes the FFMPEG command for the augmentation
+
+        @param video_path: the path to the video to be augmented
+
+        @param output_path: the path in which the resulting video will be stored.
+
+        @param threads: if set, caps the number of threads FFMPEG uses
+
+        @param async_: if set to True, FFMPEG is started without waiting for it
+            to finish
+
+        @returns: the handle of the running FFMPEG process if `async_` is set
+            to True, otherwise the FFMPEG return code
+        """
+        cmd = self.get_command(video_path, output_path)
+        if threads:
+            cmd = self.threads_fmt(cmd, int(threads))
+
+        if async_:
+            process = execute_ffmpeg_cmd_async(cmd)
+            threading.Thread(
+                target=lambda: (process.wait(), remove_command_files(cmd)), daemon=True
+            ).start()
+            return process
+        try:
+            return execute_ffmpeg_cmd(cmd)
+        finally:
+            remove_command_files(cmd)
 
     @abstractmethod
     def get_command(self, video_path: str, output_path: str) -> List[str]:
@@ -52,21 +187,356 @@ class BaseFFMPEGAugmenter(ABC):
         """
         raise NotImplementedError("Implement get_command method")
 
+    def build_many(self, inputs_outputs: List[Tuple[str, str]]) -> List[List[str]]:
+        """
+        Constructs the FFMPEG commands that apply the augmentation to several
+        videos, to be run concurrently with `execute_ffmpeg_cmds`
+
+        @param inputs_outputs: pairs of the path to a video to be augmented and
+            the path in which its resulting video will be stored. The paths
+            of a pair must differ
+
+        @returns: a list of CLI FFMPEG commands, one per pair
+        """
+        cmds = []
+        for video_path, output_path in inputs_outputs:
+            video_path, output_path = validate_input_and_output_paths(
+                video_path, output_path
+            )
+            assert video_path != output_path, \
+                "Batched augmentations can't overwrite the input video"
+            cmds.append(self.get_command(video_path, output_path))
+
+        return cmds
+
+    def apply_many(
+        self,
+        inputs_outputs: List[Tuple[str, str]],
+        max_parallel: Optional[int] = None,
+        threads: Optional[int] = None,
+        clips_per_run: int = 1,
+    ) -> List[int]:
+        """
+        Applies the augmentation to several videos, running the FFMPEG
+        processes concurrently
+
+        @param inputs_outputs: pairs of the path to a video to be augmented and
+            the path in which its resulting video will be stored. The paths
+            of a pair must differ
+
+        @param max_parallel: the maximum number of FFMPEG processes running at
+            once. If not passed in, the number of CPU cores is used
+
+        @param threads: caps the number of threads of each FFMPEG process. If
+            not passed in, the CPU cores are split between the processes, so
+            they don't oversubscribe the machine
+
+        @param clips_per_run: the number of videos each FFMPEG process augments,
+            see `build_combined`. Augmenters that can't be combined run one
+            process per video
+
+        @returns: the FFMPEG return codes, in the order of the pairs
+        """
+        assert clips_per_run > 0, "The number of clips per run must be positive"
+        cpus = os.cpu_count() or 1
+        max_parallel = max_parallel or cpus
+        threads = threads or max(1, cpus // max_parallel)
+
+        if clips_per_run > 1 and self.can_combine(inputs_outputs):
+            groups = [
+                inputs_outputs[i:i + clips_per_run]
+                for i in range(0, len(inputs_outputs), clips_per_run)
+            ]
+            cmds = [self.build_combined(group) for group in groups]
+            output_paths = [[output_path for _, output_path in group] for group in groups]
+        else:
+            groups = [[pair] for pair in inputs_outputs]
+            cmds = self.build_many(inputs_outputs)
+            output_paths = [None] * len(cmds)
+
+        returncodes = execute_ffmpeg_cmds(
+            [
+                self.threads_fmt(cmd, threads, paths)
+                for cmd, paths in zip(cmds, output_paths)
+            ],
+            max_parallel,
+        )
+        for cmd in cmds:
+            remove_command_files(cmd)
+        return [
+            returncode
+            for group, returncode in zip(groups, returncodes)
+            for _ in group
+        ]
+
+    def can_combine(self, inputs_outputs: List[Tuple[str, str]]) -> bool:
+        """
+        Checks whether the augmentation is a plain video filter chain for every
+        video, so several of them can share an FFMPEG run in `build_combined`.
+        The filter chains aren't built, as some render files along the way
+
+        @param inputs_outputs: pairs of the path to a video to be augmented and
+            the path in which its resulting video will be stored
+
+        @returns: True if the videos can be augmented by combined commands
+        """
+        if type(self).get_filter_string is BaseFFMPEGAugmenter.get_filter_string:
+            return False
+
+        return all(
+            self.get_audio_filter_string(video_path) is None
+            for video_path, _ in inputs_outputs
+        )
+
+    def build_combined(self, inputs_outputs: List[Tuple[str, str]]) -> List[str]:
+        """
+        Constructs a single FFMPEG command that applies the augmentation to
+        several videos, so the FFMPEG startup cost is paid once rather than
+        per video. Every input is decoded at the same time, so pass a few
+        short clips at once rather than a whole dataset. Only augmenters that
+        are plain video filter chains, leaving the audio as is, can be combined
+
+        @param inputs_outputs: pairs of the path to a video to be augmented and
+            the path in which its resulting video will be stored. The paths
+            of a pair must differ
+
+        @returns: a list of strings containing the CLI FFMPEG command
+        """
+        assert len(inputs_outputs) > 0, "Please provide at least one video"
+
+        inputs, filter_complex, outputs = ["-y"], [], []
+        for i, (video_path, output_path) in enumerate(inputs_outputs):
+            video_path, output_path = validate_input_and_output_paths(
+                video_path, output_path
+            )
+            assert video_path != output_path, \
+                "Combined augmentations can't overwrite the input video"
+            assert self.get_audio_filter_string(video_path) is None, \
+                "Augmentations that alter the audio can't be combined"
+
+            inputs += self.input_fmt(video_path)[1:]
+            filter_complex.append(
+                f"[{i}:v]{self.get_filter_string(video_path)},"
+                + f"pad=width=ceil(iw/2)*2:height=ceil(ih/2)*2[o{i}]"
+            )
+            outputs += [
+                "-map", f"[o{i}]",
+                "-map", f"{i}:a?",
+                "-c:a", "copy",
+                *self.output_fmt(output_path),
+            ]
+
+        return [
+            *inputs,
+            *self.script_fmt(["-filter_complex", ";".join(filter_complex)]),
+            *outputs,
+        ]
+
+    def build_stdio_command(
+        self,
+        video_path: str,
+        output_path: Optional[str] = None,
+        read_stdin: bool = False,
+        write_stdout: bool = False,
+    ) -> List[str]:
+        """
+        Constructs the FFMPEG command for the augmentation, reading the input
+        video from the standard input and/or writing the resulting video to the
+        standard output, so chained augmentations can stream between FFMPEG
+        processes rather than through intermediate files
+
+        @param video_path: the path to the video that is probed for the
+            augmentation parameters. If `read_stdin` is set to True, the video
+            streamed to the standard input is augmented instead
+
+        @param output_path: the path in which the resulting video will be stored.
+            Ignored if `write_stdout` is set to True
+
+        @param read_stdin: if set to True, the input video is read from pipe:0
+
+        @param write_stdout: if set to True, the resulting video is written to
+            pipe:1 in the NUT container
+
+        @returns: a list of strings containing the CLI FFMPEG command for
+            the augmentation
+        """
+        cmd = self.get_command(video_path, "pipe:1" if write_stdout else output_path)
+
+        if write_stdout:
+            cmd = [*cmd[:-1], "-f", "nut", "pipe:1"]
+        if read_stdin:
+            assert self.pipeable, f"{type(self).__name__} can't read from a pipe"
+            i = cmd.index("-i")
+            cmd[i:i + 2] = ["-f", "nut", "-i", "pipe:0"]
+
+        return cmd
+
+    def get_filter_string(self, video_path: str) -> str:
+        """
+        Constructs the body of the FFMPEG video filter chain, without the
+        trailing pad that keeps the output dimensions even. Augmenters that
+        need extra inputs, or alter the audio stream other than through
+        `get_audio_filter_string`, don't implement it
+
+        @param video_path: the path to the video to be augmented
+
+        @returns: a string containing the FFMPEG video filter chain for
+            the augmentation
+        """
+        raise NotImplementedError("Implement get_filter_string method")
+
+    def get_audio_filter_string(self, video_path: str) -> Optional[str]:
+        """
+        Constructs the FFMPEG audio filter chain that goes along with the video
+        filter chain of `get_filter_string`, for augmentations that also
+        alter the audio stream
+
+        @param video_path: the path to the video to be augmented
+
+        @returns: a string containing the FFMPEG audio filter chain for the
+            augmentation, or None if the audio stream is left as is
+        """
+        return None
+
     @staticmethod
-    def input_fmt(video_path: str) -> List[str]:
+    def get_encoder(encoder: Optional[str] = None) -> str:
+        """
+        Resolves which encoder family to use for the output video
+
+        @param encoder: one of "cpu", "amd", "intel" or "nvidia". If not passed in,
+            the module level default_encoder or the AUGME_ENCODER environment
+            variable is used, falling back to "cpu"
+
+        @returns: the key of the encoder in the encoders dict
+        """
+        encoder = encoder or default_encoder or os.environ.get("AUGME_ENCODER", "cpu")
+        assert encoder in encoders, \
+            f"Encoder must be one of {', '.join(encoders)}, got {encoder}"
+        return encoder
+
+    @staticmethod
+    def input_fmt(video_path: str, encoder: Optional[str] = None) -> List[str]:
+        encoder = BaseFFMPEGAugmenter.get_encoder(encoder)
+        # decode on the GPU, frames are downloaded for the CPU filters
+        hwaccel = []
+        if hwaccels.get(encoder) in get_hwaccels():
+            hwaccel = ["-hwaccel", hwaccels[encoder]]
         return [
             "-y", # overwrite existing
+            *hwaccel,
             "-i", video_path, # input video
         ]
 
     @staticmethod
-    def output_fmt(output_path: str) -> List[str]:
+    def output_fmt(
+        output_path: str,
+        encoder: Optional[str] = None,
+        preset: Optional[str] = None,
+        crf: Optional[int] = None,
+        tune: Optional[str] = None,
+        pix_fmt: Optional[str] = "yuv420p",
+    ) -> List[str]:
+        encoder = BaseFFMPEGAugmenter.get_encoder(encoder)
+        preset = preset or default_preset or os.environ.get("AUGME_PRESET") \
+            or presets[encoder]
+        crf = crf if crf is not None else default_crf
+        crf = str(crf if crf is not None else os.environ.get("AUGME_CRF", 23))
+        tune = tune or default_tune or os.environ.get("AUGME_TUNE")
+
+        if encoder == "nvidia":
+            quality = ["-preset", preset, "-cq", crf]
+        elif encoder == "amd":
+            quality = ["-quality", preset, "-rc", "cqp", "-qp_i", crf, "-qp_p", crf]
+        elif encoder == "intel":
+            quality = ["-preset", preset, "-global_quality", crf]
+        else:
+            quality = ["-preset", preset, "-crf", crf]
+            # the tunings are specific to libx264
+            if tune:
+                quality += ["-tune", tune]
+
         return [
-            "-c:v", "libx264", # video encoder
-            "-preset", "slow", # encoding speed to compression ratio
-            "-crf", "23", # constant rate factor for constant quality encoding
-            "-pix_fmt", "yuv420p", # pixel format YUV 4:2:0
-            output_path, # output video
+            "-c:v", encoders[encoder], # video encoder
+            *quality, # encoding speed & constant quality encoding
+            *(["-pix_fmt", pix_fmt] if pix_fmt else []), # pixel format YUV 4:2:0
+            *BaseFFMPEGAugmenter.container_fmt(output_path),
+        ]
+
+    @staticmethod
+    def container_fmt(output_path: str) -> List[str]:
+        """
+        Constructs the muxer options for the output video, also used on its own
+        when the streams are copied rather than encoded
+
+        @param output_path: the path in which the resulting video will be stored.
+
+        @returns: a list of strings containing the muxer options, ending with
+            the output path
+        """
+        # write the index at the start of mp4/mov files, so they can be read
+        # without seeking to the end first
+        faststart = []
+        if os.path.splitext(output_path)[1].lower() in (".mp4", ".mov", ".m4v"):
+            faststart = ["-movflags", "+faststart"]
+
+        return [*faststart, output_path]
+
+    @staticmethod
+    def threads_fmt(
+        cmd: List[str], threads: int, output_paths: Optional[List[str]] = None
+    ) -> List[str]:
+        """
+        Caps the number of threads of an FFMPEG command, for the filter graph
+        and for the encoder of each output video
+
+        @param cmd: a list of strings containing the CLI FFMPEG command, ending
+            with the output path
+
+        @param threads: the maximum number of threads
+
+        @param output_paths: the output paths of the command, in order, for
+            commands with several outputs (see `build_combined`). If not passed
+            in, the command has a single output, its last argument
+
+        @returns: the CLI FFMPEG command with the thread options added
+        """
+        assert threads > 0, "Threads must be a positive number"
+        cmd = [
+            "-filter_threads", str(threads), # simple filter graph threads
+            "-filter_complex_threads", str(threads), # complex filter graph threads
+            *cmd,
+        ]
+
+        # the encoder options apply to the next output only
+        if output_paths is None:
+            indices = [len(cmd) - 1]
+        else:
+            indices, start = [], 0
+            for output_path in output_paths:
+                start = cmd.index(output_path, start) + 1
+                indices.append(start - 1)
+
+        for i in reversed(indices):
+            cmd[i:i] = ["-threads", str(threads)] # encoder threads
+        return cmd
+
+    @staticmethod
+    def copy_fmt(video_path: str, output_path: str) -> List[str]:
+        """
+        Constructs the FFMPEG command that rewraps every stream of the video
+        without re-encoding, for augmentations that would leave it unchanged
+
+        @param video_path: the path to the video to be augmented
+
+        @param output_path: the path in which the resulting video will be stored.
+
+        @returns: a list of strings containing the CLI FFMPEG command
+        """
+        return [
+            *BaseFFMPEGAugmenter.input_fmt(video_path),
+            "-map", "0",
+            "-c", "copy",
+            *BaseFFMPEGAugmenter.container_fmt(output_path),
         ]
 
     @staticmethod
@@ -75,6 +545,128 @@ class BaseFFMPEGAugmenter(ABC):
     ) -> List[str]:
         return [
             *BaseFFMPEGAugmenter.input_fmt(video_path),
-            *filters,
+            *BaseFFMPEGAugmenter.script_fmt(filters),
             *BaseFFMPEGAugmenter.output_fmt(output_path),
         ]
+
+    @staticmethod
+    def script_fmt(filters: List[str]) -> List[str]:
+        """
+        Moves the filter graphs longer than `script_threshold` characters to
+        script files, which FFMPEG reads instead of the command line
+
+        @param filters: a list of strings containing FFMPEG options, where
+            "-vf" and "-filter_complex" are followed by their filter graph
+
+        @returns: the options with the long filter graphs replaced by script files
+        """
+        filters = list(filters)
+        for i, option in enumerate(filters[:-1]):
+            if option in script_options and len(filters[i + 1]) > script_threshold:
+                fd, path = tempfile.mkstemp(suffix=".txt", prefix=".augme-")
+                with os.fdopen(fd, "w", encoding="utf-8") as file:
+                    file.write(filters[i + 1])
+                command_files.append(path)
+                filters[i:i + 2] = [script_options[option], path]
+
+        return filters
+
+    @staticmethod
+    def gpu_filter_fmt(
+        video_path: str, gpu_filters: Dict[str, str], output_path: str
+    ) -> Optional[List[str]]:
+        """
+        Constructs the FFMPEG command that decodes and filters the video on the
+        GPU of the encoder in use. The GPU encoder reads the filtered frames
+        from the GPU memory, unless they have to be padded on the CPU first
+
+        @param video_path: the path to the video to be augmented
+
+        @param gpu_filters: the GPU filter chains of the augmentation, keyed
+            by the hwaccel of the encoder, e.g. "cuda"
+
+        @param output_path: the path in which the resulting video will be stored.
+
+        @returns: a list of strings containing the CLI FFMPEG command, or None
+            if FFMPEG can't run the augmentation on the GPU of the encoder
+        """
+        hwaccel = hwaccels.get(BaseFFMPEGAugmenter.get_encoder())
+        gpu_filter = gpu_filters.get(hwaccel)
+        if (
+            gpu_filter is None
+            or hwaccel not in get_hwaccels()
+            or gpu_filter.split("=")[0] not in get_filters()
+        ):
+            return None
+
+        pad = maybe_pad_even(video_path)
+        if pad:
+            filters = ["-vf", f"{gpu_filter},hwdownload,format=nv12{pad}"]
+            output = BaseFFMPEGAugmenter.output_fmt(output_path)
+        else:
+            # the frames stay in the GPU format, so no -pix_fmt conversion
+            filters = ["-vf", gpu_filter]
+            output = BaseFFMPEGAugmenter.output_fmt(output_path, pix_fmt=None)
+
+        return [
+            "-y",
+            "-hwaccel", hwaccel,
+            "-hwaccel_output_format", hwaccel, # keep the decoded frames on the GPU
+            "-i", video_path,
+            *filters,
+            "-c:a", "copy",
+            *output,
+        ]
+
+    @staticmethod
+    def batch_filter_fmt(
+        video_path: str,
+        filter_strings: List[str],
+        output_paths: List[str],
+        threads: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Decodes the video once, splits the decoded stream and writes one output
+        per filter chain, so that every augmentation shares a single FFMPEG run
+
+        @param video_path: the path to the video to be augmented
+
+        @param filter_strings: the video filter chains, one per output
+
+        @param output_paths: the paths in which the resulting videos will be stored
+
+        @param threads: if set, caps the number of threads of the filter graph
+            and of each encoder, otherwise FFMPEG picks the count
+
+        @returns: a list of strings containing the CLI FFMPEG command for
+            the augmentations
+        """
+        assert len(filter_strings) == len(output_paths), \
+            "Expected one output path per filter string"
+
+        labels = [f"[v{i}]" for i in range(len(filter_strings))]
+        filter_complex = [f"[0:v]split={len(filter_strings)}" + "".join(labels)]
+        outputs = []
+        for i, (filter_string, output_path) in enumerate(zip(filter_strings, output_paths)):
+            filter_complex.append(
+                f"{labels[i]}{filter_string},"
+                + f"pad=width=ceil(iw/2)*2:height=ceil(ih/2)*2[o{i}]"
+            )
+            outputs += [
+                "-map", f"[o{i}]",
+                "-threads", str(threads or 0), # encoder threads, 0 is automatic
+                "-map", "0:a?",
+                "-c:a", "copy",
+                *BaseFFMPEGAugmenter.output_fmt(output_path),
+            ]
+
+        filter_threads = ["-filter_complex_threads", str(threads)] if threads else []
+
+        return [
+            *filter_threads,
+            *BaseFFMPEGAugmenter.input_fmt(video_path),
+            *BaseFFMPEGAugmenter.script_fmt(
+                ["-filter_complex", ";".join(filter_complex)]
+            ),
+            *outputs,
+        ]
@@ -1,12 +1,36 @@
+from math import sqrt
 from typing import List
 from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
+from augme.video.helpers import maybe_pad_even
 
 
 class VideoAugmenterByBlur(BaseFFMPEGAugmenter):
-    def __init__(self, sigma: float):
+    def __init__(self, sigma: float, exact: bool = False):
         assert sigma >= 0, "Sigma cannot be a negative number"
         
         self.sigma = sigma
+        self.exact = exact
+
+        if exact or sigma <= 3.0:
+            self.filter_string = f"gblur={sigma}"
+        else:
+            # three box blurs of radius r have a variance of r * (r + 1), which
+            # approximates a wide Gaussian at a cost independent of sigma
+            radius = max(1, round((sqrt(4 * sigma ** 2 + 1) - 1) / 2))
+            self.filter_string = \
+                f"boxblur=luma_radius='min({radius},min(w,h)/2)':luma_power=3" \
+                + f":chroma_radius='min({radius},min(cw,ch)/2)':chroma_power=3"
+
+    def get_filter_string(self, video_path: str) -> str:
+        """
+        Constructs the FFMPEG video filter chain that blurs the video
+
+        @param video_path: the path to the video to be augmented
+
+        @returns: a string containing the FFMPEG video filter chain for
+            the augmentation
+        """
+        return self.filter_string
 
     def get_command(self, video_path: str, output_path: str) -> List[str]:
         """
@@ -19,9 +43,13 @@ class VideoAugmenterByBlur(BaseFFMPEGAugmenter):
         @returns: a list of strings containing the CLI FFMPEG command for
             the augmentation
         """
+        # a zero sigma leaves the video unchanged
+        if self.sigma < 1e-6:
+            return self.copy_fmt(video_path, output_path)
+
         filters = [
-            "-vf", f"gblur={self.sigma},"
-            + "pad=width=ceil(iw/2)*2:height=ceil(ih/2)*2",
+            "-vf", self.get_filter_string(video_path)
+            + maybe_pad_even(video_path),
             "-c:a", "copy",
         ]
 
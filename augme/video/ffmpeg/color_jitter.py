@@ -1,5 +1,6 @@
 from typing import List
 from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
+from augme.video.helpers import maybe_pad_even
 
 
 class VideoAugmenterByColorJitter(BaseFFMPEGAugmenter):
@@ -22,6 +23,22 @@ class VideoAugmenterByColorJitter(BaseFFMPEGAugmenter):
         self.brightness_factor = brightness_factor
         self.contrast_factor = contrast_factor
         self.saturation_factor = saturation_factor
+        self.filter_string = (
+            f"eq=brightness={brightness_factor}"
+            + f":contrast={contrast_factor}"
+            + f":saturation={saturation_factor}"
+        )
+
+    def get_filter_string(self, video_path: str) -> str:
+        """
+        Constructs the FFMPEG video filter chain that color jitters the video
+
+        @param video_path: the path to the video to be augmented
+
+        @returns: a string containing the FFMPEG video filter chain for
+            the augmentation
+        """
+        return self.filter_string
 
     def get_command(self, video_path: str, output_path: str) -> List[str]:
         """
@@ -35,10 +52,8 @@ class VideoAugmenterByColorJitter(BaseFFMPEGAugmenter):
             the augmentation
         """
         filters = [
-            "-vf", f"eq=brightness={self.brightness_factor}"
-            + f":contrast={self.contrast_factor}"
-            + f":saturation={self.saturation_factor},"
-            + "pad=width=ceil(iw/2)*2:height=ceil(ih/2)*2",
+            "-vf", self.get_filter_string(video_path)
+            + maybe_pad_even(video_path),
             "-c:a", "copy",
         ]
 
@@ -1,26 +1,155 @@
+import os
+import tempfile
+from itertools import chain
 from math import ceil
-from typing import List, Tuple
-from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
-from augme.video.helpers import get_video_info, validate_path, validate_rgb_color
+from typing import List, Optional, Tuple
+from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter, command_files
+from augme.video.helpers import (
+    get_audio_info,
+    get_video_info,
+    validate_path,
+    validate_rgb_color,
+)
+
+# the stream parameters that must match for the videos to be joined by the
+# concat demuxer without re-encoding
+copy_video_fields = ("codec_name", "width", "height", "pix_fmt", "r_frame_rate", "sample_aspect_ratio")
+copy_audio_fields = ("codec_name", "sample_rate", "channels")
 
 
 class VideoAugmenterByConcat(BaseFFMPEGAugmenter):
+    # the inputs are the given video paths, not the augmented video
+    pipeable = False
+
     def __init__(
         self,
         video_paths: List[str],
         src_video_path_index: int,
         pad_color: Tuple[int, int, int],
+        needs_silent_audio: Optional[List[bool]] = None,
+        trims: Optional[List[Tuple[Optional[float], Optional[float]]]] = None,
     ):
         assert len(video_paths) > 0, "Please provide at least one input video"
         assert len(video_paths) > src_video_path_index, "Please provide a valid src_video_path_index"
         validate_rgb_color(pad_color)
         [validate_path(video_path) for video_path in video_paths]
+        needs_silent_audio = needs_silent_audio or [False] * len(video_paths)
+        assert len(needs_silent_audio) == len(video_paths), \
+            "Please provide a silent audio flag for every input video"
+        trims = trims or [(None, None)] * len(video_paths)
+        assert len(trims) == len(video_paths), \
+            "Please provide a trim for every input video"
 
         self.video_paths = video_paths
         self.src_video_path_index = src_video_path_index
         self.video_infos = [get_video_info(path) for path in video_paths]
         self.hex_color = "%02x%02x%02x" % pad_color
-        
+
+        # the command only depends on the input videos, so build it once
+        video_info = self.video_infos[self.src_video_path_index]
+        height = ceil(video_info["height"] / 2) * 2
+        width = ceil(video_info["width"] / 2) * 2
+        self.frame_rate = video_info["r_frame_rate"]
+
+        self.copy = (
+            self.can_copy(needs_silent_audio) and trims == [(None, None)] * len(video_paths)
+        )
+        if self.copy:
+            return
+
+        # the trimmed videos are seeked and cut on the input, so only the
+        # kept part is decoded
+        video_inputs, durations = [], []
+        for video, info, (start, end) in zip(self.video_paths, self.video_infos, trims):
+            if start is None and end is None:
+                video_inputs.append(["-i", video])
+                durations.append(info["duration"])
+                continue
+
+            start = start or 0
+            end = info["duration"] if end is None else min(end, info["duration"])
+            assert end > start, "Trims must keep a part of every input video"
+            video_inputs.append(["-ss", str(start), "-t", str(end - start), "-i", video])
+            durations.append(end - start)
+
+        # the videos without audio are paired with a silent audio source of
+        # the same duration, added as an extra input after the videos
+        silent_inputs, audio_labels = [], []
+        for i, (duration, silent) in enumerate(zip(durations, needs_silent_audio)):
+            if silent:
+                audio_labels.append(f"[{len(video_paths) + len(silent_inputs)}:a]")
+                silent_inputs.append([
+                    "-f", "lavfi",
+                    "-t", str(duration),
+                    "-i", "anullsrc=channel_layout=stereo:sample_rate=44100",
+                ])
+            else:
+                audio_labels.append(f"[{i}:a]")
+
+        self.flat_inputs = list(chain.from_iterable(video_inputs)) \
+            + list(chain.from_iterable(silent_inputs))
+        scale_fragments, maps = [], []
+        for i, info in enumerate(self.video_infos):
+            if (info['width'] / info['height']) < (width / height):
+                scale_fragments.append(f"[{i}:v:0]scale=w=-1:h={height}[{i}scale];")
+            else:
+                scale_fragments.append(f"[{i}:v:0]scale=w={width}:h=-1[{i}scale];")
+            scale_fragments.append(
+                f"[{i}scale]pad=w={width}:h={height}:x=(ow-iw)/2:y=(oh-ih)/2:color={self.hex_color}[{i}pad];"
+                f"[{i}pad]setsar=ratio=1:1[{i}sar],"
+                f"[{i}sar]setdar=ratio={width / height}[{i}v];"
+            )
+            maps.append(f"[{i}v]{audio_labels[i]}")
+        self.filter_complex = "".join(scale_fragments) + "".join(maps) \
+            + f"concat=n={len(self.video_paths)}:v=1:a=1[v][a]"
+
+    def can_copy(self, needs_silent_audio: List[bool]) -> bool:
+        """
+        Checks whether the videos can be joined without re-encoding, i.e. they
+        all have audio and share their codecs, size, pixel format and frame rate
+
+        @param needs_silent_audio: whether each video has to be given silent audio
+
+        @returns: True if the streams of the videos can be copied as they are
+        """
+        if any(needs_silent_audio):
+            return False
+
+        video_info = self.video_infos[0]
+        if video_info["width"] % 2 or video_info["height"] % 2 or \
+                video_info.get("sample_aspect_ratio", "1:1") != "1:1":
+            return False
+
+        audio_infos = [get_audio_info(path) for path in self.video_paths]
+        if None in audio_infos:
+            return False
+
+        return all(
+            info.get(field) == video_info.get(field)
+            for info in self.video_infos for field in copy_video_fields
+        ) and all(
+            info.get(field) == audio_infos[0].get(field)
+            for info in audio_infos for field in copy_audio_fields
+        )
+
+    @staticmethod
+    def write_list(video_paths: List[str]) -> str:
+        """
+        Writes the list of videos read by the concat demuxer, deleted once the
+        command reading it has run
+
+        @param video_paths: the paths to the videos to be concatenated
+
+        @returns: the path to the list file
+        """
+        fd, path = tempfile.mkstemp(suffix=".txt", prefix=".augme-")
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            for video_path in video_paths:
+                escaped = os.path.abspath(video_path).replace("'", "'\\''")
+                file.write(f"file '{escaped}'\n")
+        command_files.append(path)
+
+        return path
 
     def get_command(self, video_path: str, output_path: str) -> List[str]:
         """
@@ -33,34 +162,26 @@ class VideoAugmenterByConcat(BaseFFMPEGAugmenter):
         @returns: a list of strings containing the CLI FFMPEG command for
             the augmentation
         """
-        video_info = self.video_infos[self.src_video_path_index]
-        height = ceil(video_info["height"] / 2) * 2
-        width = ceil(video_info["width"] / 2) * 2
-        frame_rate = video_info["r_frame_rate"]
-
-        inputs = [["-i", video] for video in self.video_paths]
-        flat_inputs = [element for sublist in inputs for element in sublist]
-        scale_filter, maps = "", ""
-        for i in range(len(self.video_paths)):
-            if (self.video_infos[i]['width'] / self.video_infos[i]['height']) < (width / height):
-                scale_filter += f"[{i}:v:0]scale=w=-1:h={height}[{i}scale];"
-            else:
-                scale_filter += f"[{i}:v:0]scale=w={width}:h=-1[{i}scale];"
-            scale_filter += (
-                f"[{i}scale]pad=w={width}:h={height}:x=(ow-iw)/2:y=(oh-ih)/2:color={self.hex_color}[{i}pad];"
-                f"[{i}pad]setsar=ratio=1:1[{i}sar],"
-                f"[{i}sar]setdar=ratio={width / height}[{i}v];"
-            )
-            maps += f"[{i}v][{i}:a]"
+        if self.copy:
+            return [
+                "-y",
+                "-f", "concat",
+                "-safe", "0",
+                "-i", self.write_list(self.video_paths),
+                "-map", "0:v:0",
+                "-map", "0:a:0",
+                "-c", "copy",
+                *self.container_fmt(output_path),
+            ]
 
         return [
             "-y",
-            *flat_inputs,
-            "-filter_complex", scale_filter + maps + f"concat=n={len(self.video_paths)}:v=1:a=1[v][a]",
+            *self.flat_inputs,
+            *self.script_fmt(["-filter_complex", self.filter_complex]),
             "-map", "[v]",
             "-map", "[a]",
             "-fps_mode", "cfr", # duplicate and drop frames for constant frame rate
-            "-r", str(frame_rate),
+            "-r", str(self.frame_rate),
             "-c:a", "aac",
             *self.output_fmt(output_path),
         ]
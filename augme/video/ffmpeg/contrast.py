@@ -1,5 +1,6 @@
 from typing import List
 from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
+from augme.video.helpers import maybe_pad_even
 
 
 class VideoAugmenterByContrast(BaseFFMPEGAugmenter):
@@ -9,6 +10,18 @@ class VideoAugmenterByContrast(BaseFFMPEGAugmenter):
         ), "Level must be a value in the range [-1000, 1000]"
         
         self.level = level
+        self.filter_string = f"eq=contrast={level}"
+
+    def get_filter_string(self, video_path: str) -> str:
+        """
+        Constructs the FFMPEG video filter chain that changes the contrast level of the video
+
+        @param video_path: the path to the video to be augmented
+
+        @returns: a string containing the FFMPEG video filter chain for
+            the augmentation
+        """
+        return self.filter_string
 
     def get_command(self, video_path: str, output_path: str) -> List[str]:
         """
@@ -22,9 +35,13 @@ class VideoAugmenterByContrast(BaseFFMPEGAugmenter):
         @returns: a list of strings containing the CLI FFMPEG command for
             the augmentation
         """
+        # a level of one leaves the video unchanged
+        if abs(self.level - 1.0) < 1e-6:
+            return self.copy_fmt(video_path, output_path)
+
         filters = [
-            "-vf", f"eq=contrast={self.level},"
-            + "pad=width=ceil(iw/2)*2:height=ceil(ih/2)*2",
+            "-vf", self.get_filter_string(video_path)
+            + maybe_pad_even(video_path),
             "-c:a", "copy",
         ]
 
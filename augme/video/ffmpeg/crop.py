@@ -5,6 +5,8 @@ import math
 
 
 class VideoAugmenterByCrop(BaseFFMPEGAugmenter):
+    changes_size = True
+
     def __init__(self, left: float, top: float, right: float, bottom: float):
         assert 0.0 <= left <= 1.0, "Left must be a value in the range [0.0, 1.0]"
         assert 0.0 <= top <= 1.0, "Top must be a value in the range [0.0, 1.0]"
@@ -15,6 +17,30 @@ class VideoAugmenterByCrop(BaseFFMPEGAugmenter):
         self.top = top
         self.right = right
         self.bottom = bottom
+        # crop filters already built, keyed on the video dimensions
+        self.filter_strings = {}
+
+    def get_filter_string(self, video_path: str) -> str:
+        """
+        Constructs the FFMPEG video filter chain that crops the video
+
+        @param video_path: the path to the video to be augmented
+
+        @returns: a string containing the FFMPEG video filter chain for
+            the augmentation
+        """
+        video_info = get_video_info(video_path)
+        dimensions = (video_info["width"], video_info["height"])
+
+        if dimensions not in self.filter_strings:
+            x1 = int(video_info["width"] * self.left)
+            y1 = int(video_info["height"] * self.top)
+            width = math.ceil(int(video_info["width"] * (self.right - self.left)) / 2) * 2
+            height = math.ceil(int(video_info["height"] * (self.bottom - self.top)) / 2) * 2
+
+            self.filter_strings[dimensions] = f"crop=w={width}:h={height}:x={x1}:y={y1}"
+
+        return self.filter_strings[dimensions]
 
     def get_command(self, video_path: str, output_path: str) -> List[str]:
         """
@@ -27,15 +53,8 @@ class VideoAugmenterByCrop(BaseFFMPEGAugmenter):
         @returns: a list of strings containing the CLI FFMPEG command for
             the augmentation
         """
-        video_info = get_video_info(video_path)
-
-        x1 = int(video_info["width"] * self.left)
-        y1 = int(video_info["height"] * self.top)
-        width = math.ceil(int(video_info["width"] * (self.right - self.left)) / 2) * 2
-        height = math.ceil(int(video_info["height"] * (self.bottom - self.top)) / 2) * 2
-
         filters = [
-            "-vf", f"crop=w={width}:h={height}:x={x1}:y={y1}",
+            "-vf", self.get_filter_string(video_path),
             "-c:a", "copy",
         ]
 
@@ -1,8 +1,30 @@
 from typing import List, Tuple
 from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
+from augme.video.helpers import maybe_pad_even
+
+
+# p(X,Y) - p(X-4,Y-4) factors into (p(X,Y) + p(X-2,Y-2)) followed by
+# (q(X,Y) - q(X-2,Y-2)), so the emboss runs as two native 5x5 convolutions
+SUM_KERNEL = " ".join(["1"] + ["0"] * 11 + ["1"] + ["0"] * 12)
+DIFF_KERNEL = " ".join(["-1"] + ["0"] * 11 + ["1"] + ["0"] * 12)
 
 
 class VideoAugmenterByEmboss(BaseFFMPEGAugmenter):
+    def get_filter_string(self, video_path: str) -> str:
+        """
+        Constructs the FFMPEG video filter chain that embosses the video
+
+        @param video_path: the path to the video to be augmented
+
+        @returns: a string containing the FFMPEG video filter chain for
+            the augmentation
+        """
+        return (
+            "format=gray"
+            + f",convolution=0m='{SUM_KERNEL}':0rdiv=0.5"
+            + f",convolution=0m='{DIFF_KERNEL}':0rdiv=1:0bias=128"
+        )
+
     def get_command(self, video_path: str, output_path: str) -> List[str]:
         """
         Embosses a video
@@ -17,8 +39,8 @@ class VideoAugmenterByEmboss(BaseFFMPEGAugmenter):
         """
 
         filters = [
-            "-filter_complex", f"format=gray,geq=lum_expr='(p(X,Y)+(256-p(X-4,Y-4)))/2',"
-            + "pad=width=ceil(iw/2)*2:height=ceil(ih/2)*2",
+            "-filter_complex", self.get_filter_string(video_path)
+            + maybe_pad_even(video_path),
             "-c:a", "copy",
         ]
 
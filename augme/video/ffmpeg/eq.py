@@ -0,0 +1,119 @@
+from typing import List, Optional
+from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
+from augme.video.ffmpeg.brightness import VideoAugmenterByBrightness
+from augme.video.ffmpeg.color_jitter import VideoAugmenterByColorJitter
+from augme.video.ffmpeg.contrast import VideoAugmenterByContrast
+from augme.video.helpers import maybe_pad_even
+
+
+class VideoAugmenterByEq(BaseFFMPEGAugmenter):
+    def __init__(
+        self,
+        brightness: float = 0.0,
+        contrast: float = 1.0,
+        saturation: float = 1.0,
+        gamma: float = 1.0,
+    ):
+        assert (
+            -1.0 <= brightness <= 1.0
+        ), "Brightness must be a value in the range [-1.0, 1.0]"
+        assert (
+            -1000.0 <= contrast <= 1000.0
+        ), "Contrast must be a value in the range [-1000, 1000]"
+        assert (
+            0.0 <= saturation <= 3.0
+        ), "Saturation must be a value in the range [0.0, 3.0]"
+        assert 0.1 <= gamma <= 10.0, "Gamma must be a value in the range [0.1, 10.0]"
+
+        self.brightness = brightness
+        self.contrast = contrast
+        self.saturation = saturation
+        self.gamma = gamma
+        self.filter_string = (
+            f"eq=brightness={brightness}"
+            + f":contrast={contrast}"
+            + f":saturation={saturation}"
+            + f":gamma={gamma}"
+        )
+
+    @classmethod
+    def from_augmenter(
+        cls, augmenter: BaseFFMPEGAugmenter
+    ) -> Optional["VideoAugmenterByEq"]:
+        """
+        Expresses an augmenter built on the eq filter as a VideoAugmenterByEq
+
+        @param augmenter: the augmenter to be converted
+
+        @returns: the equivalent VideoAugmenterByEq, or None if the augmenter
+            isn't built on the eq filter
+        """
+        if isinstance(augmenter, cls):
+            return augmenter
+        if isinstance(augmenter, VideoAugmenterByBrightness):
+            return cls(brightness=augmenter.level)
+        if isinstance(augmenter, VideoAugmenterByContrast):
+            return cls(contrast=augmenter.level)
+        if isinstance(augmenter, VideoAugmenterByColorJitter):
+            return cls(
+                brightness=augmenter.brightness_factor,
+                contrast=augmenter.contrast_factor,
+                saturation=augmenter.saturation_factor,
+            )
+        return None
+
+    def fuse(self, other: "VideoAugmenterByEq") -> Optional["VideoAugmenterByEq"]:
+        """
+        Fuses this augmentation followed by another one into a single eq filter.
+        The luma is mapped as contrast * (y - 0.5) + 0.5 + brightness and then
+        gamma corrected, so two passes compose as long as the first one doesn't
+        apply gamma. Clipping between the two passes is not reproduced
+
+        @param other: the augmentation applied after this one
+
+        @returns: the fused augmentation, or None if the two can't be fused
+        """
+        brightness = self.brightness * other.contrast + other.brightness
+        contrast = self.contrast * other.contrast
+        saturation = self.saturation * other.saturation
+
+        if (
+            self.gamma != 1.0
+            or not -1.0 <= brightness <= 1.0
+            or not -1000.0 <= contrast <= 1000.0
+            or not 0.0 <= saturation <= 3.0
+        ):
+            return None
+
+        return VideoAugmenterByEq(brightness, contrast, saturation, other.gamma)
+
+    def get_filter_string(self, video_path: str) -> str:
+        """
+        Constructs the FFMPEG video filter chain that changes the brightness,
+        contrast, saturation and gamma of the video in a single pass
+
+        @param video_path: the path to the video to be augmented
+
+        @returns: a string containing the FFMPEG video filter chain for
+            the augmentation
+        """
+        return self.filter_string
+
+    def get_command(self, video_path: str, output_path: str) -> List[str]:
+        """
+        Changes the brightness, contrast, saturation and gamma of the video
+
+        @param video_path: the path to the video to be augmented
+
+        @param output_path: the path in which the resulting video will be stored.
+
+        @returns: a list of strings containing the CLI FFMPEG command for
+            the augmentation
+        """
+        filters = [
+            "-vf", self.get_filter_string(video_path)
+            + maybe_pad_even(video_path),
+            "-c:a", "copy",
+        ]
+
+        return self.standard_filter_fmt(video_path, filters, output_path)
@@ -1,11 +1,24 @@
 from typing import List
 from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
+from augme.video.helpers import maybe_pad_even
 
 
 class VideoAugmenterByFPSChange(BaseFFMPEGAugmenter):
     def __init__(self, fps: int):
         assert fps > 0, "FPS must be greater than zero"
         self.fps = fps
+        self.filter_string = f"fps=fps={fps}:round=up"
+
+    def get_filter_string(self, video_path: str) -> str:
+        """
+        Constructs the FFMPEG video filter chain that changes the frame rate of the video
+
+        @param video_path: the path to the video to be augmented
+
+        @returns: a string containing the FFMPEG video filter chain for
+            the augmentation
+        """
+        return self.filter_string
 
     def get_command(self, video_path: str, output_path: str) -> List[str]:
         """
@@ -19,8 +32,8 @@ class VideoAugmenterByFPSChange(BaseFFMPEGAugmenter):
             the augmentation
         """
         filters = [
-            "-vf", f"fps=fps={self.fps}:round=up,"
-            + "pad=width=ceil(iw/2)*2:height=ceil(ih/2)*2",
+            "-vf", self.get_filter_string(video_path)
+            + maybe_pad_even(video_path),
             "-c:a", "copy",
         ]
 
@@ -4,12 +4,15 @@ from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
 from augme.video.helpers import (
     get_video_info,
     get_audio_info,
+    prefetch_media_info,
     validate_path,
     validate_rgb_color,
 )
 
 
 class VideoAugmenterByFStack(BaseFFMPEGAugmenter):
+    changes_size = True
+
     def __init__(
         self,
         second_video_path: str,
@@ -21,6 +24,7 @@ class VideoAugmenterByFStack(BaseFFMPEGAugmenter):
         pad_video: bool,
         pad_color: Tuple[int, int, int],
         max_height: int,
+        force_scale_ref: bool = False,
     ):
         assert target_grid in [0,1,2,3], "Valid target_grid is one of 0,1,2,3"
         validate_rgb_color(pad_color)
@@ -33,8 +37,25 @@ class VideoAugmenterByFStack(BaseFFMPEGAugmenter):
         self.preserve_aspect_ratio = preserve_aspect_ratio
         self.pad_video = pad_video
         self.hex_color = "%02x%02x%02x" % pad_color
+        # centres the other videos on a canvas of the pad color
+        self.center_pad = f":x=(ow-iw)/2:y=(oh-ih)/2:color={self.hex_color}"
         self.max_height = max_height
-
+        self.force_scale_ref = force_scale_ref
+
+        # the stacking order and the final scaling only depend on the
+        # constructor arguments
+        stack_orders = [
+            ("[0v][1pad]", "[2pad][3pad]"),
+            ("[1pad][0v]", "[2pad][3pad]"),
+            ("[1pad][2pad]", "[0v][3pad]"),
+            ("[1pad][2pad]", "[3pad][0v]"),
+        ]
+        stack_order_h1, stack_order_h2 = stack_orders[target_grid]
+        self.hstack_filter = f"{stack_order_h1}hstack=inputs=2[1hstack];" \
+            + f"{stack_order_h2}hstack=inputs=2[2hstack];"
+        self.scale_filter = \
+            f"[vstack]scale=w=-1:h='min(ih,{max_height})',setsar=ratio=1:1[vscale];" \
+            + "[vscale]pad=w=ceil(iw/2)*2:h=ceil(ih/2)*2[v]" # ensure divisible by 2
 
     def get_command(self, video_path: str, output_path: str) -> List[str]:
         """
@@ -48,6 +69,9 @@ class VideoAugmenterByFStack(BaseFFMPEGAugmenter):
         @returns: a list of strings containing the CLI FFMPEG command for
             the augmentation
         """
+        # probe the four inputs concurrently, the lookups below hit the cache
+        prefetch_media_info([video_path, *self.video_paths])
+
         video_info = get_video_info(video_path)
         audio_info = get_audio_info(video_path)
 
@@ -60,7 +84,7 @@ class VideoAugmenterByFStack(BaseFFMPEGAugmenter):
         audio_filter = ""
         audio_codec = ["-c:a", "copy",]
         if (self.merge_audio and audio_info and audio_infos[0] and audio_infos[1] and audio_infos[2]):
-            audio_filter = ";[0:a:0][1:a:0][2:a:0][3:a:0]amerge=inputs=4,pan=stereo|c0<c0+c2+c4+c6|c1<c1+c3+c5+c7[a]"
+            audio_filter = ";[0:a:0][1:a:0][2:a:0][3:a:0]amix=inputs=4:duration=shortest:normalize=0[a]"
             audio_map = ["-map",  "[a]",]
             audio_codec = [
                 "-c:a", "aac", # audio encoder
@@ -71,37 +95,50 @@ class VideoAugmenterByFStack(BaseFFMPEGAugmenter):
         else:
             audio_map = ["-map", "0:a?",]
 
-        if self.target_grid == 0:
-            stack_order_h1 = "[0:v:0][1pad]"
-            stack_order_h2 = "[2pad][3pad]"
-        elif self.target_grid == 1:
-            stack_order_h1 = "[1pad][0:v:0]"
-            stack_order_h2 = "[2pad][3pad]"
-        elif self.target_grid == 2:
-            stack_order_h1 = "[1pad][2pad]"
-            stack_order_h2 = "[0:v:0][3pad]"
-        elif self.target_grid == 3:
-            stack_order_h1 = "[1pad][2pad]"
-            stack_order_h2 = "[3pad][0:v:0]"
-            
+        # an odd-sized main video is padded to even dimensions within the graph,
+        # and the other videos are fitted to the padded size
+        width = ceil(video_info['width'] / 2) * 2
+        height = ceil(video_info['height'] / 2) * 2
+        if (width, height) != (video_info['width'], video_info['height']):
+            main_filter = f"[0:v:0]pad=w={width}:h={height}[0v];"
+        else:
+            main_filter = "[0:v:0]null[0v];"
 
         if self.preserve_aspect_ratio:
             scale_width = "-1"
         else:
-            scale_width = video_info['width']
+            scale_width = width
 
+        pad = f"pad=w={width}:h={height}{self.center_pad}"
         video_filters = []
         for i in range(len(video_infos)):
-            video_filter = f"[{i+1}:v:0]scale=w={scale_width}:h={video_info['height']}[{i+1}v];"
-            if (self.pad_video and (video_info['width'] < video_info['height'] / video_infos[i]['height'] * video_infos[i]['width'])):
-                video_filter += f"[{i+1}v]scale=w={video_info['width']}:h=-1[{i+1}scale];"\
-                    + f"[{i+1}scale]pad=w={video_info['width']}:h={video_info['height']}:x=(ow-iw)/2:y=(oh-ih)/2:color={self.hex_color}[{i+1}pad];"
+            video_filter = f"[{i+1}:v:0]scale=w={scale_width}:h={height}[{i+1}v];"
+            if (self.pad_video and (width < height / video_infos[i]['height'] * video_infos[i]['width'])):
+                video_filter += f"[{i+1}v]scale=w={width}:h=-1[{i+1}scale];"\
+                    + f"[{i+1}scale]{pad}[{i+1}pad];"
             elif self.pad_video:
-                video_filter += f"[{i+1}v]pad=w={video_info['width']}:h={video_info['height']}:x=(ow-iw)/2:y=(oh-ih)/2:color={self.hex_color}[{i+1}pad];"
+                video_filter += f"[{i+1}v]{pad}[{i+1}pad];"
             else:
                 video_filter += f"[{i+1}v]null[{i+1}pad];"
             video_filters.append(video_filter)
 
+        # the rows already have the same width when every tile is resized to
+        # the main video's size, or when every tile scaled to its height
+        # (scale=w=-1 rounds the width to the nearest pixel) is exactly as wide
+        rows_aligned = (
+            not self.preserve_aspect_ratio
+            or self.pad_video
+            or all(
+                (2 * height * vinfo['width'] + vinfo['height']) // (2 * vinfo['height']) == width
+                for vinfo in video_infos
+            )
+        )
+        if rows_aligned and not self.force_scale_ref:
+            vstack_filter = "[1hstack][2hstack]vstack=inputs=2[vstack];"
+        else:
+            vstack_filter = "[2hstack][1hstack]scale2ref=w=oh*mdar:h=-1[2hs][1hs];" \
+                + "[1hs][2hs]vstack=inputs=2[vstack];"
+
         filters = [
             "-stream_loop", str(n_loops[0]),
             "-i", self.video_paths[0],
@@ -113,18 +150,16 @@ class VideoAugmenterByFStack(BaseFFMPEGAugmenter):
             "-i", self.video_paths[2],
             "-t", f"{video_info['duration']}",
             "-filter_complex",
-            "".join(video_filters)
-            + f"{stack_order_h1}hstack=inputs=2[1hstack];"
-            + f"{stack_order_h2}hstack=inputs=2[2hstack];"
-            + f"[2hstack][1hstack]scale2ref=w=oh*mdar:h=-1[2hs][1hs];"
-            + f"[1hs][2hs]vstack=inputs=2[vstack];"
-            + f"[vstack]scale=w=-1:h='min(ih,{self.max_height})',setsar=ratio=1:1[vscale];"
-            + f"[vscale]pad=w=ceil(iw/2)*2:h=ceil(ih/2)*2[v]" # ensure divisible by 2
-            + audio_filter,
+            "".join([
+                main_filter,
+                *video_filters,
+                self.hstack_filter,
+                vstack_filter,
+                self.scale_filter,
+                audio_filter,
+            ]),
             "-map", "[v]",
             *audio_map,
-            "-fps_mode", "cfr", # duplicate and drop frames for constant frame rate
-            "-r", str(video_info['r_frame_rate']),
             *audio_codec,
          ]
 
@@ -1,8 +1,36 @@
+from itertools import count
 from typing import List
 from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
+from augme.video.helpers import get_video_info, maybe_pad_even
+
+# numbers the filter graph labels, so several gradients can share one graph
+labels = count()
 
 
 class VideoAugmenterByGradient(BaseFFMPEGAugmenter):
+    def get_filter_string(self, video_path: str) -> str:
+        """
+        Constructs the FFMPEG video filter chain that overlays a horizontal gradient onto the video
+
+        @param video_path: the path to the video to be augmented
+
+        @returns: a string containing the FFMPEG video filter chain for
+            the augmentation
+        """
+        video_info = get_video_info(video_path)
+        size = f"{video_info['width']}x{video_info['height']}"
+        label = f"gradient{next(labels)}"
+
+        # the gradient is evaluated on a single frame, which the blend filter
+        # then multiplies onto every frame of the video. It is scaled to the
+        # incoming frames, which differ from the probed size when earlier
+        # augmentations of a pipeline resize the video
+        return f"format=gbrp[{label}v];" \
+            + f"nullsrc=s={size}:r=1:d=1,format=gbrp," \
+            + "geq=r='255*X/W':g='255*(1-X/W)':b='255*(H-Y)/H'" \
+            + f"[{label}g];[{label}g][{label}v]scale2ref=w=rw:h=rh[{label}gs][{label}vs];" \
+            + f"[{label}vs][{label}gs]blend=all_mode=multiply"
+
     def get_command(self, video_path: str, output_path: str) -> List[str]:
         """
         Overlays a horizontal gradient onto a video
@@ -16,8 +44,8 @@ class VideoAugmenterByGradient(BaseFFMPEGAugmenter):
             the augmentation
         """
         filters = [
-            "-filter_complex", f"geq=r='X/W*r(X,Y)':g='(1-X/W)*g(X,Y)':b='(H-Y)/H*b(X,Y)',"
-            + "pad=width=ceil(iw/2)*2:height=ceil(ih/2)*2",
+            "-filter_complex", self.get_filter_string(video_path)
+            + maybe_pad_even(video_path),
             "-c:a", "copy",
         ]
 
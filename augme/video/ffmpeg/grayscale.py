@@ -1,8 +1,29 @@
 from typing import List
 from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
+from augme.video.helpers import maybe_pad_even
 
 
 class VideoAugmenterByGrayscale(BaseFFMPEGAugmenter):
+    def __init__(self, method: str = "format"):
+        assert method in ["format", "hue"], "Method must be one of 'format', 'hue'"
+
+        self.method = method
+
+    def get_filter_string(self, video_path: str) -> str:
+        """
+        Constructs the FFMPEG video filter chain that changes the video to be grayscale
+
+        @param video_path: the path to the video to be augmented
+
+        @returns: a string containing the FFMPEG video filter chain for
+            the augmentation
+        """
+        if self.method == "hue":
+            return "hue=s=0"
+
+        # dropping the chroma planes needs no per-pixel arithmetic
+        return "format=gray"
+
     def get_command(self, video_path: str, output_path: str) -> List[str]:
         """
         Changes the video to be grayscale
@@ -15,8 +36,8 @@ class VideoAugmenterByGrayscale(BaseFFMPEGAugmenter):
             the augmentation
         """
         filters = [
-            "-vf", "hue=s=0,"
-            + "pad=width=ceil(iw/2)*2:height=ceil(ih/2)*2",
+            "-vf", self.get_filter_string(video_path)
+            + maybe_pad_even(video_path),
             "-c:a", "copy",
         ]
 
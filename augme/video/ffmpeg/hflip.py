@@ -1,8 +1,20 @@
 from typing import List
 from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
+from augme.video.helpers import maybe_pad_even
 
 
 class VideoAugmenterByHFlip(BaseFFMPEGAugmenter):
+    def get_filter_string(self, video_path: str) -> str:
+        """
+        Constructs the FFMPEG video filter chain that horizontally flips the video
+
+        @param video_path: the path to the video to be augmented
+
+        @returns: a string containing the FFMPEG video filter chain for
+            the augmentation
+        """
+        return "hflip"
+
     def get_command(self, video_path: str, output_path: str, **kwargs) -> List[str]:
         """
         Horizontally flips the video
@@ -15,8 +27,8 @@ class VideoAugmenterByHFlip(BaseFFMPEGAugmenter):
             the augmentation
         """
         filters = [
-            "-vf", "hflip,"
-            + "pad=width=ceil(iw/2)*2:height=ceil(ih/2)*2",
+            "-vf", self.get_filter_string(video_path)
+            + maybe_pad_even(video_path),
             "-c:a", "copy",
         ]
 
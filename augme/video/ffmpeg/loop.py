@@ -1,8 +1,12 @@
 from typing import List
 from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
+from augme.video.helpers import get_video_info
 
 
 class VideoAugmenterByLoops(BaseFFMPEGAugmenter):
+    # -stream_loop needs to seek back to the start of the input
+    pipeable = False
+
     def __init__(self, num_loops: int):
         assert num_loops >= 0, "Number of loops cannot be a negative number"
         
@@ -19,6 +23,18 @@ class VideoAugmenterByLoops(BaseFFMPEGAugmenter):
         @returns: a list of strings containing the CLI FFMPEG command for
             the augmentation
         """
+        video_info = get_video_info(video_path)
+        if video_info and not (video_info["width"] % 2 or video_info["height"] % 2):
+            # nothing to pad, so the looped streams are rewrapped as they are
+            return [
+                "-y",
+                "-stream_loop", str(self.num_loops),
+                "-i", video_path,
+                "-map", "0",
+                "-c", "copy",
+                *self.container_fmt(output_path),
+            ]
+
         return [
             "-y",
             "-stream_loop",
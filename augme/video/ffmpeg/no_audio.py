@@ -1,5 +1,6 @@
 from typing import List
 from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
+from augme.video.helpers import maybe_pad_even
 
 
 class VideoAugmenterByRemovingAudio(BaseFFMPEGAugmenter):
@@ -15,8 +16,19 @@ class VideoAugmenterByRemovingAudio(BaseFFMPEGAugmenter):
         @returns: a list of strings containing the CLI FFMPEG command for
             the augmentation
         """
+        pad = maybe_pad_even(video_path)
+        if not pad:
+            # the video stream is left as is, so it is copied
+            return [
+                *self.input_fmt(video_path),
+                "-map", "0:v",
+                "-c:v", "copy",
+                "-an",
+                *self.container_fmt(output_path),
+            ]
+
         filters = [
-            "-vf", "pad=width=ceil(iw/2)*2:height=ceil(ih/2)*2",
+            "-vf", pad.lstrip(","),
             "-an",
         ]
 
@@ -1,6 +1,6 @@
 from typing import List
 from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
-from augme.video.helpers import get_audio_info
+from augme.video.helpers import get_audio_info, maybe_pad_even
 
 
 class VideoAugmenterByNoise(BaseFFMPEGAugmenter):
@@ -31,8 +31,11 @@ class VideoAugmenterByNoise(BaseFFMPEGAugmenter):
                 "-c:a", "aac",
             ]
 
+        pad = maybe_pad_even(video_path)
+        video_filter = ["-vf", pad.lstrip(",")] if pad else []
+
         filters = [
-            "-vf", "pad=width=ceil(iw/2)*2:height=ceil(ih/2)*2",
+            *video_filter,
             "-bsf:v", f"noise={self.level}",
             *audio_filter,
         ]
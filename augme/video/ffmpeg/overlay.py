@@ -1,6 +1,11 @@
-from typing import List
+from typing import List, Optional
 from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
-from augme.video.helpers import get_video_info, validate_path, get_audio_info
+from augme.video.helpers import (
+    get_video_info,
+    validate_path,
+    get_audio_info,
+    maybe_pad_even,
+)
 from math import ceil
 
 
@@ -11,15 +16,22 @@ class VideoAugmenterByOverlay(BaseFFMPEGAugmenter):
         x_factor: float,
         y_factor: float,
         merge_audio: bool,
+        overlay_filter: Optional[str] = None,
+        overlay_loops: int = 0,
     ):
         validate_path(overlay_path)
         assert 0 <= x_factor <= 1, "x_factor must be a value in the range [0, 1]"
         assert 0 <= y_factor <= 1, "y_factor must be a value in the range [0, 1]"
+        assert overlay_loops >= 0, "Number of overlay loops cannot be a negative number"
 
         self.overlay_path = overlay_path
         self.x_factor = x_factor
         self.y_factor = y_factor
         self.merge_audio = merge_audio
+        # the overlaid media is prepared (e.g. resized) within the same graph
+        self.overlay_input = f"[1:v]{overlay_filter}[ov];[0:v][ov]" \
+            if overlay_filter else "[0:v][1:v]"
+        self.overlay_loops = overlay_loops
 
     def get_command(self, video_path: str, output_path: str) -> List[str]:
         """
@@ -42,7 +54,7 @@ class VideoAugmenterByOverlay(BaseFFMPEGAugmenter):
         audio_filter = ""
         audio_codec = ["-c:a", "copy",]
         if (self.merge_audio and audio_info and overlay_audio_info):
-            audio_filter = ";[0:a:0][1:a:0]amerge=inputs=2,pan=stereo|c0<c0+c2|c1<c1+c3[a]"
+            audio_filter = ";[0:a:0][1:a:0]amix=inputs=2:duration=shortest:normalize=0[a]"
             audio_map = ["-map",  "[a]",]
             audio_codec = [
                 "-c:a", "aac", # audio encoder
@@ -55,17 +67,17 @@ class VideoAugmenterByOverlay(BaseFFMPEGAugmenter):
         else:
             audio_map = ["-map", "0:a?",]
 
+        loop = ["-stream_loop", str(self.overlay_loops)] if self.overlay_loops else []
         filters = [
+            *loop,
             "-i", self.overlay_path,
             "-t", str(video_info["duration"]),
-            "-filter_complex", f"[0:v][1:v]overlay=x={x}:y={y}[ov];"
-            + "[ov]pad=width=ceil(iw/2)*2:height=ceil(ih/2)*2[v]"
+            "-filter_complex", f"{self.overlay_input}overlay=x={x}:y={y}"
+            + maybe_pad_even(video_path) + "[v]"
             + audio_filter,
             "-map", "[v]",
             *audio_map,
             *audio_codec,
-            "-fps_mode", "cfr", # duplicate and drop frames for constant frame rate
-            "-r", str(video_info['r_frame_rate']),
         ]
 
         return self.standard_filter_fmt(video_path, filters, output_path)
@@ -1,9 +1,11 @@
 from typing import List, Tuple
 from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
-from augme.video.helpers import get_video_info, validate_rgb_color
+from augme.video.helpers import get_video_info, maybe_pad_even, validate_rgb_color
 
 
 class VideoAugmenterByPadding(BaseFFMPEGAugmenter):
+    changes_size = True
+
     def __init__(self, w_factor: float, h_factor: float, color: Tuple[int, int, int]):
         assert w_factor >= 0, "w_factor cannot be a negative number"
         assert h_factor >= 0, "h_factor cannot be a negative number"
@@ -12,6 +14,30 @@ class VideoAugmenterByPadding(BaseFFMPEGAugmenter):
         self.w_factor = w_factor
         self.h_factor = h_factor
         self.hex_color = "%02x%02x%02x" % color
+        # pad filters already built, keyed on the video dimensions
+        self.filter_strings = {}
+
+    def get_filter_string(self, video_path: str) -> str:
+        """
+        Constructs the FFMPEG video filter chain that adds padding to the video
+
+        @param video_path: the path to the video to be augmented
+
+        @returns: a string containing the FFMPEG video filter chain for
+            the augmentation
+        """
+        video_info = get_video_info(video_path)
+        dimensions = (video_info["width"], video_info["height"])
+
+        if dimensions not in self.filter_strings:
+            left = int(video_info["width"] * self.w_factor)
+            top = int(video_info["height"] * self.h_factor)
+
+            self.filter_strings[dimensions] = \
+                f"pad=width={left*2}+ceil(iw/2)*2:height={top*2}+ceil(ih/2)*2" \
+                + f":x={left}:y={top}:color={self.hex_color}"
+
+        return self.filter_strings[dimensions]
 
     def get_command(self, video_path: str, output_path: str) -> List[str]:
         """
@@ -24,14 +50,12 @@ class VideoAugmenterByPadding(BaseFFMPEGAugmenter):
         @returns: a list of strings containing the CLI FFMPEG command for
             the augmentation
         """
-        video_info = get_video_info(video_path)
-
-        left = int(video_info["width"] * self.w_factor)
-        top = int(video_info["height"] * self.h_factor)
+        # without margins, only odd dimensions are padded
+        if self.w_factor == 0 and self.h_factor == 0 and not maybe_pad_even(video_path):
+            return self.copy_fmt(video_path, output_path)
 
         filters = [
-            "-vf",  f"pad=width={left*2}+ceil(iw/2)*2:height={top*2}+ceil(ih/2)*2"
-            + f":x={left}:y={top}:color={self.hex_color}",
+            "-vf",  self.get_filter_string(video_path),
             "-c:a", "copy",
         ]
 
@@ -0,0 +1,186 @@
+from typing import List, Optional, Tuple
+from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
+from augme.video.ffmpeg.eq import VideoAugmenterByEq
+from augme.video.ffmpeg.loop import VideoAugmenterByLoops
+
+
+class VideoAugmenterPipeline(BaseFFMPEGAugmenter):
+    def __init__(self, augmenters: List[BaseFFMPEGAugmenter]):
+        assert len(augmenters) > 0, "Please provide at least one augmenter"
+
+        # the loops leading the pipeline become a single -stream_loop on the
+        # input. Later ones can't be moved in front of the time dependent
+        # augmenters (e.g. text, random frames), so they need their own run
+        n_leading = 0
+        while n_leading < len(augmenters) and self.is_loop(augmenters[n_leading]):
+            n_leading += 1
+        loops, augmenters = augmenters[:n_leading], augmenters[n_leading:]
+        assert not any(self.is_loop(augmenter) for augmenter in augmenters), \
+            "Loops can only lead a pipeline, see `split_runs`"
+        assert all(
+            type(augmenter).get_filter_string
+            is not BaseFFMPEGAugmenter.get_filter_string
+            for augmenter in augmenters
+        ), "Only augmenters that are plain filter chains or loops can be composed"
+
+        plays = 1
+        for loop in loops:
+            plays *= loop.num_loops + 1
+        self.num_loops = plays - 1
+        self.pipeable = not self.num_loops
+
+        self.augmenters = self.fuse(augmenters) if augmenters else []
+        self.changes_size = any(augmenter.changes_size for augmenter in self.augmenters)
+
+    @staticmethod
+    def is_loop(augmenter: BaseFFMPEGAugmenter) -> bool:
+        """
+        Checks whether the augmenter loops the video, which the pipeline applies
+        on the input rather than in the filter chain
+
+        @param augmenter: the augmenter to be checked
+
+        @returns: True if the augmenter is a loop augmenter
+        """
+        return isinstance(augmenter, VideoAugmenterByLoops)
+
+    @staticmethod
+    def split_runs(
+        augmenters: List[BaseFFMPEGAugmenter],
+    ) -> List[List[BaseFFMPEGAugmenter]]:
+        """
+        Splits the augmenters into the runs that can share a pipeline. A run
+        ends after a change of dimensions, since the augmenters deriving their
+        parameters from the frame size probe the video they are given, and
+        before a loop following other augmenters, since only leading loops
+        are applied on the input
+
+        @param augmenters: the augmenters in the order they are applied
+
+        @returns: the runs of augmenters, in order
+        """
+        runs: List[List[BaseFFMPEGAugmenter]] = []
+        for augmenter in augmenters:
+            if (
+                runs
+                and not runs[-1][-1].changes_size
+                and not (
+                    VideoAugmenterPipeline.is_loop(augmenter)
+                    and not VideoAugmenterPipeline.is_loop(runs[-1][-1])
+                )
+            ):
+                runs[-1].append(augmenter)
+            else:
+                runs.append([augmenter])
+
+        return runs
+
+    @staticmethod
+    def fuse(augmenters: List[BaseFFMPEGAugmenter]) -> List[BaseFFMPEGAugmenter]:
+        """
+        Merges consecutive brightness, contrast, color jitter and eq augmenters
+        into a single eq augmenter, so their pixels are only traversed once
+
+        @param augmenters: the augmenters in the order they are applied
+
+        @returns: the augmenters with the eq runs fused
+        """
+        fused = [augmenters[0]]
+        for augmenter in augmenters[1:]:
+            previous = VideoAugmenterByEq.from_augmenter(fused[-1])
+            current = VideoAugmenterByEq.from_augmenter(augmenter)
+            merged = previous.fuse(current) if previous and current else None
+
+            if merged is not None:
+                fused[-1] = merged
+            else:
+                fused.append(augmenter)
+
+        return fused
+
+    def get_filter_string(self, video_path: str) -> str:
+        """
+        Constructs the FFMPEG video filter chain that applies every augmentation
+        of the pipeline in order. Augmenters that derive their parameters from
+        the video dimensions (e.g. crop, pad) probe the source video, so they
+        can't follow a change of dimensions (see `split_runs`)
+
+        @param video_path: the path to the video to be augmented
+
+        @returns: a string containing the FFMPEG video filter chain for
+            the augmentation
+        """
+        if self.num_loops:
+            raise NotImplementedError("Looping pipelines need an input option")
+        if self.get_audio_filter_string(video_path):
+            raise NotImplementedError("Pipelines that alter the audio need an audio chain")
+
+        return self.get_filter_chain(video_path)
+
+    def get_filter_chain(self, video_path: str) -> str:
+        """
+        Joins the filter chains of the pipeline's augmenters, leaving the loops out
+
+        @param video_path: the path to the video to be augmented
+
+        @returns: a string containing the FFMPEG video filter chain
+        """
+        return ",".join(
+            augmenter.get_filter_string(video_path) for augmenter in self.augmenters
+        ) or "null"
+
+    def can_combine(self, inputs_outputs: List[Tuple[str, str]]) -> bool:
+        """
+        Checks whether the pipeline is a plain video filter chain for every
+        video, so several of them can share an FFMPEG run in `build_combined`
+
+        @param inputs_outputs: pairs of the path to a video to be augmented and
+            the path in which its resulting video will be stored
+
+        @returns: True if the videos can be augmented by combined commands
+        """
+        # the loops are applied on the input, outside of the filter chain
+        return not self.num_loops and super().can_combine(inputs_outputs)
+
+    def get_audio_filter_string(self, video_path: str) -> Optional[str]:
+        """
+        Joins the audio filter chains of the pipeline's augmenters that alter
+        the audio stream
+
+        @param video_path: the path to the video to be augmented
+
+        @returns: a string containing the FFMPEG audio filter chain, or None
+            if the audio stream is left as is
+        """
+        audio_filters = [
+            augmenter.get_audio_filter_string(video_path)
+            for augmenter in self.augmenters
+        ]
+        return ",".join(f for f in audio_filters if f) or None
+
+    def get_command(self, video_path: str, output_path: str) -> List[str]:
+        """
+        Applies every augmentation of the pipeline in a single FFMPEG run
+
+        @param video_path: the path to the video to be augmented
+
+        @param output_path: the path in which the resulting video will be stored.
+
+        @returns: a list of strings containing the CLI FFMPEG command for
+            the augmentation
+        """
+        audio_filter = self.get_audio_filter_string(video_path)
+        audio = ["-af", audio_filter, "-c:a", "aac"] if audio_filter else ["-c:a", "copy"]
+
+        filters = [
+            "-vf", self.get_filter_chain(video_path)
+            + ",pad=width=ceil(iw/2)*2:height=ceil(ih/2)*2",
+            *audio,
+        ]
+        cmd = self.standard_filter_fmt(video_path, filters, output_path)
+
+        if self.num_loops:
+            cmd.insert(cmd.index("-i"), "-stream_loop")
+            cmd.insert(cmd.index("-i"), str(self.num_loops))
+
+        return cmd
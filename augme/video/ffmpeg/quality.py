@@ -1,5 +1,6 @@
 from typing import List
 from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
+from augme.video.helpers import maybe_pad_even
 
 
 class VideoAugmenterByQuality(BaseFFMPEGAugmenter):
@@ -20,9 +21,12 @@ class VideoAugmenterByQuality(BaseFFMPEGAugmenter):
         @returns: a list of strings containing the CLI FFMPEG command for
             the augmentation
         """
+        pad = maybe_pad_even(video_path)
+        video_filter = ["-vf", pad.lstrip(",")] if pad else []
+
         return [
             *self.input_fmt(video_path),
-            "-vf", "pad=width=ceil(iw/2)*2:height=ceil(ih/2)*2",
+            *video_filter,
             "-c:v", "libx264",
             "-crf", f"{self.quality}",
             "-preset", "slow",
@@ -1,5 +1,6 @@
 from typing import List
 from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
+from augme.video.helpers import maybe_pad_even
 
 
 class VideoAugmenterByRandomFrames(BaseFFMPEGAugmenter):
@@ -9,6 +10,17 @@ class VideoAugmenterByRandomFrames(BaseFFMPEGAugmenter):
         self.num_frames = num_frames
 
 
+    def get_filter_string(self, video_path: str) -> str:
+        """
+        Constructs the FFMPEG video filter chain that shuffles the cached video frames
+
+        @param video_path: the path to the video to be augmented
+
+        @returns: a string containing the FFMPEG video filter chain for
+            the augmentation
+        """
+        return f"random=frames={self.num_frames}"
+
     def get_command(self, video_path: str, output_path: str) -> List[str]:
         """
         Flushes video frames from internal cache of frames into a random order
@@ -22,8 +34,8 @@ class VideoAugmenterByRandomFrames(BaseFFMPEGAugmenter):
             the augmentation
         """
         filters = [
-            "-vf", f"random=frames={self.num_frames},"
-            + "pad=width=ceil(iw/2)*2:height=ceil(ih/2)*2",
+            "-vf", self.get_filter_string(video_path)
+            + maybe_pad_even(video_path),
             "-c:a", "copy",
         ]
 
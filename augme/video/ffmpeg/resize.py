@@ -1,28 +1,36 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
 from augme.video.helpers import get_video_info
 from math import ceil
 
 
+# swscale scaling algorithms, from the fastest to the most accurate
+scaling_flags = ["fast_bilinear", "bilinear", "bicubic", "area", "neighbor", "lanczos"]
+
+
 class VideoAugmenterByResize(BaseFFMPEGAugmenter):
-    def __init__(self, width: Optional[int], height: Optional[int]):
+    changes_size = True
+
+    def __init__(
+        self, width: Optional[int], height: Optional[int], flags: str = "bicubic"
+    ):
         assert width is None or width > 0, "Width must be set to None or be positive"
         assert height is None or height > 0, "Height must be set to None or be positive"
+        assert flags in scaling_flags, \
+            f"Flags must be one of {', '.join(scaling_flags)}"
         
         self.width, self.height = width, height
-        
+        self.flags = flags
+        # resize filters already built, keyed on the video dimensions
+        self.filter_strings = {}
 
-    def get_command(self, video_path: str, output_path: str) -> List[str]:
+    def get_output_size(self, video_path: str) -> Tuple[int, int]:
         """
-        Resizes the video
+        Computes the dimensions of the resized video, rounded up to even numbers
 
         @param video_path: the path to the video to be augmented
 
-        @param output_path: the path in which the resulting video will be stored.
-            If not passed in, the original video file will be overwritten
-
-        @returns: a list of strings containing the CLI FFMPEG command for
-            the augmentation
+        @returns: the width and height of the resized video
         """
         video_info = get_video_info(video_path)
 
@@ -39,11 +47,62 @@ class VideoAugmenterByResize(BaseFFMPEGAugmenter):
             new_width = ceil(video_info["width"] / 2) * 2
             new_height = ceil(video_info["height"] / 2) * 2
 
+        return new_width, new_height
+
+    def get_filter_string(self, video_path: str) -> str:
+        """
+        Constructs the FFMPEG video filter chain that resizes the video
+
+        @param video_path: the path to the video to be augmented
+
+        @returns: a string containing the FFMPEG video filter chain for
+            the augmentation
+        """
+        video_info = get_video_info(video_path)
+        dimensions = (video_info["width"], video_info["height"])
+        if dimensions in self.filter_strings:
+            return self.filter_strings[dimensions]
+
+        new_width, new_height = self.get_output_size(video_path)
+        self.filter_strings[dimensions] = \
+            f"scale=width={new_width}:height={new_height}:flags={self.flags}," \
+            + "setsar=ratio=1:1," \
+            + f"setdar=ratio={new_width / new_height}"
+
+        return self.filter_strings[dimensions]
+
+    def get_command(self, video_path: str, output_path: str) -> List[str]:
+        """
+        Resizes the video
+
+        @param video_path: the path to the video to be augmented
+
+        @param output_path: the path in which the resulting video will be stored.
+            If not passed in, the original video file will be overwritten
+
+        @returns: a list of strings containing the CLI FFMPEG command for
+            the augmentation
+        """
+        # a video that already has the target size and square pixels is
+        # left unchanged
+        width, height = self.get_output_size(video_path)
+        video_info = get_video_info(video_path)
+        if (width, height) == (video_info["width"], video_info["height"]) \
+                and video_info.get("sample_aspect_ratio", "1:1") == "1:1":
+            return self.copy_fmt(video_path, output_path)
+
+        # the GPU scalers don't take the swscale flags
+        aspect = f"setsar=ratio=1:1,setdar=ratio={width / height}"
+        gpu_cmd = self.gpu_filter_fmt(video_path, {
+            "cuda": f"scale_cuda=w={width}:h={height},{aspect}",
+            "qsv": f"vpp_qsv=w={width}:h={height},{aspect}",
+        }, output_path)
+        if gpu_cmd:
+            return gpu_cmd
+
+        # the scaled dimensions are already rounded to even numbers
         filters = [
-            "-vf",  f"scale=width={new_width}:height={new_height},"
-            + "pad=width=ceil(iw/2)*2:height=ceil(ih/2)*2,"
-            + "setsar=ratio=1:1,"
-            + f"setdar=ratio={new_width / new_height}",
+            "-vf",  self.get_filter_string(video_path),
         ]
 
         return self.standard_filter_fmt(video_path, filters, output_path)
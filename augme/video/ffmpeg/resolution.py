@@ -1,12 +1,32 @@
 from typing import List
 from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
+from augme.video.helpers import maybe_pad_even
 
 
 class VideoAugmenterByResolution(BaseFFMPEGAugmenter):
+    changes_size = True
+
     def __init__(self, factor: float):
         assert factor > 0.0, "Scale factor must be positive"
 
         self.factor = factor
+        # the scaled dimensions are rounded to even numbers, which the yuv420p
+        # encoders require, so no pad is needed afterwards
+        self.filter_string = f"scale=width=round(iw*{factor}/2)*2" \
+            + f":height=round(ih*{factor}/2)*2"
+        size = f"w=round(iw*{factor}/2)*2:h=round(ih*{factor}/2)*2"
+        self.gpu_filters = {"cuda": f"scale_cuda={size}", "qsv": f"vpp_qsv={size}"}
+
+    def get_filter_string(self, video_path: str) -> str:
+        """
+        Constructs the FFMPEG video filter chain that alters the resolution of the video
+
+        @param video_path: the path to the video to be augmented
+
+        @returns: a string containing the FFMPEG video filter chain for
+            the augmentation
+        """
+        return self.filter_string
 
     def get_command(self, video_path: str, output_path: str) -> List[str]:
         """
@@ -20,9 +40,17 @@ class VideoAugmenterByResolution(BaseFFMPEGAugmenter):
         @returns: a list of strings containing the CLI FFMPEG command for
             the augmentation
         """
+        # the scale only rounds the dimensions to even numbers when the
+        # factor is one, so a video with even dimensions is left unchanged
+        if self.factor == 1.0 and not maybe_pad_even(video_path):
+            return self.copy_fmt(video_path, output_path)
+
+        gpu_cmd = self.gpu_filter_fmt(video_path, self.gpu_filters, output_path)
+        if gpu_cmd:
+            return gpu_cmd
+
         filters = [
-            "-vf", f"scale=height:ih*{self.factor}:width=iw*{self.factor},"
-            + "pad=width=ceil(iw/2)*2:height=ceil(ih/2)*2"
+            "-vf", self.get_filter_string(video_path),
         ]
 
         return self.standard_filter_fmt(video_path, filters, output_path)
@@ -1,11 +1,24 @@
 from math import pi
 from typing import List
 from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
+from augme.video.helpers import maybe_pad_even
 
 
 class VideoAugmenterByRotation(BaseFFMPEGAugmenter):
     def __init__(self, degrees: float):
         self.degrees = degrees
+        self.filter_string = f"rotate={degrees * (pi / 180)}"
+
+    def get_filter_string(self, video_path: str) -> str:
+        """
+        Constructs the FFMPEG video filter chain that rotates the video
+
+        @param video_path: the path to the video to be augmented
+
+        @returns: a string containing the FFMPEG video filter chain for
+            the augmentation
+        """
+        return self.filter_string
 
     def get_command(self, video_path: str, output_path: str) -> List[str]:
         """
@@ -19,9 +32,13 @@ class VideoAugmenterByRotation(BaseFFMPEGAugmenter):
         @returns: a list of strings containing the CLI FFMPEG command for
             the augmentation
         """
+        # full turns leave a video with even dimensions unchanged
+        pad = maybe_pad_even(video_path)
+        if self.degrees % 360 == 0 and not pad:
+            return self.copy_fmt(video_path, output_path)
+
         filters = [
-            "-vf",  f"rotate={self.degrees * (pi / 180)},"
-            + "pad=width=ceil(iw/2)*2:height=ceil(ih/2)*2",
+            "-vf",  self.get_filter_string(video_path) + pad,
             "-c:a", "copy",
         ]
         
@@ -21,5 +21,5 @@ class VideoAugmenterByAddingSilentAudio(BaseFFMPEGAugmenter):
             "-c:v", "copy",
             "-c:a", "aac",
             "-shortest",
-            output_path,
+            *self.container_fmt(output_path),
         ]
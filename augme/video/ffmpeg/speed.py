@@ -1,5 +1,6 @@
 from typing import List
 from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
+from augme.video.helpers import maybe_pad_even
 
 
 class VideoAugmenterBySpeed(BaseFFMPEGAugmenter):
@@ -7,6 +8,30 @@ class VideoAugmenterBySpeed(BaseFFMPEGAugmenter):
         assert factor > 0, "Factor must be greater than zero"
         
         self.factor = factor
+        self.video_filter = f"setpts={1 / factor}*PTS"
+        self.audio_filter = f"atempo={factor}"
+
+    def get_filter_string(self, video_path: str) -> str:
+        """
+        Constructs the FFMPEG video filter chain that changes the speed of the video
+
+        @param video_path: the path to the video to be augmented
+
+        @returns: a string containing the FFMPEG video filter chain for
+            the augmentation
+        """
+        return self.video_filter
+
+    def get_audio_filter_string(self, video_path: str) -> str:
+        """
+        Constructs the FFMPEG audio filter chain that changes the speed of the audio
+
+        @param video_path: the path to the video to be augmented
+
+        @returns: a string containing the FFMPEG audio filter chain for
+            the augmentation
+        """
+        return self.audio_filter
 
     def get_command(self, video_path: str, output_path: str) -> List[str]:
         """
@@ -21,9 +46,8 @@ class VideoAugmenterBySpeed(BaseFFMPEGAugmenter):
             the augmentation
         """
         filters = [
-            "-vf", f"setpts={1/self.factor}*PTS,"
-            + "pad=width=ceil(iw/2)*2:height=ceil(ih/2)*2",
-            "-af", f"atempo={self.factor}",
+            "-vf", self.video_filter + maybe_pad_even(video_path),
+            "-af", self.audio_filter,
             "-c:a", "aac",
         ]
 
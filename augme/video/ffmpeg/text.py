@@ -1,7 +1,8 @@
 from typing import List
-from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
+from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter, command_files
 from augme.video.helpers import (
     get_video_info,
+    maybe_pad_even,
     validate_rgb_color,
     TEXT_DIR,
     FONTS_DIR,
@@ -9,7 +10,37 @@ from augme.video.helpers import (
 import os
 import random
 import string
+import tempfile
+from functools import lru_cache
+from itertools import count
 from math import ceil
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+# numbers the filter graph labels, so several text overlays can share one graph
+labels = count()
+# overlays the image of the i-th line onto the output of the previous line
+line_template = "movie={image},format=rgba[{label}t{i}];" \
+    + "[{label}v{i}][{label}t{i}]overlay=x=W-{speed}*100*t:y={y}:format=auto{output}"
+
+
+@lru_cache(maxsize=None)
+def load_corpus(name: str, top_n: int = 3000) -> np.ndarray:
+    """
+    Reads a word list from the text assets. Each list is only read once
+
+    @param name: the file name of the word list in the text assets directory
+
+    @param top_n: the number of most frequent words to keep
+
+    @returns: a read-only array of the words, from the most to the least frequent
+    """
+    with open(os.path.join(TEXT_DIR, name), 'r', encoding="utf-8") as file:
+        words = np.array(file.read().splitlines()[:top_n], dtype=object)
+
+    words.flags.writeable = False
+    return words
+
 
 class VideoAugmenterByText(BaseFFMPEGAugmenter):
     def __init__(self, font: str, fontsize: float, num_lines: int, opacity: float):
@@ -21,17 +52,58 @@ class VideoAugmenterByText(BaseFFMPEGAugmenter):
         self.num_lines = num_lines
         self.opacity = opacity
 
+        # the most frequent 3000 words of each language, paired with the text
+        # length factor of the language
+        self.corpora = (
+            (load_corpus("TOCFL_7517.txt"), 1.5),
+            (load_corpus("Longman_Communication_3000.txt"), 0.8),
+            (load_corpus("RU_10000.txt"), 0.7),
+        )
 
-    def get_command(self, video_path: str, output_path: str) -> List[str]:
+    def render_line(self, text: str, fontsize: int, color: str) -> str:
         """
-        Overlays random text onto a video
+        Renders a line of text onto a translucent black box, so that FFMPEG
+        only has to overlay it instead of rasterizing the glyphs on every frame
 
-        @param video_path: the path to the video to be augmented
+        @param text: the text to be overlaid
 
-        @param output_path: the path in which the resulting video will be stored.
-            If not passed in, the original video file will be overwritten
+        @param fontsize: the font size in pixels
 
-        @returns: a list of strings containing the CLI FFMPEG command for
+        @param color: the text color as a hex RGB string
+
+        @returns: the path of the image, escaped for the FFMPEG filter chain
+        """
+        font = ImageFont.truetype(self.font, fontsize)
+        _, _, width, height = ImageDraw.Draw(Image.new("RGBA", (1, 1))).textbbox(
+            (0, 0), text, font=font
+        )
+        size = (max(width, 1), max(height, 1))
+
+        box = Image.new("RGBA", size, (0, 0, 0, int(255 * self.opacity * 0.2)))
+        line = Image.new("RGBA", size, (0, 0, 0, 0))
+        ImageDraw.Draw(line).text(
+            (0, 0),
+            text,
+            font=font,
+            fill=(*bytes.fromhex(color), int(255 * self.opacity)),
+        )
+
+        fd, path = tempfile.mkstemp(suffix=".png", prefix=".augme-")
+        os.close(fd)
+        Image.alpha_composite(box, line).save(path)
+        # deleted once the command overlaying it has run
+        command_files.append(path)
+
+        return path.replace("\\", "/").replace(":", "\\:")
+
+    def get_filter_string(self, video_path: str) -> str:
+        """
+        Constructs the FFMPEG video filter chain that overlays random text
+        onto a video
+
+        @param video_path: the path to the video to be augmented
+
+        @returns: a string containing the FFMPEG video filter chain for
             the augmentation
         """
         video_info = get_video_info(video_path)
@@ -39,49 +111,50 @@ class VideoAugmenterByText(BaseFFMPEGAugmenter):
         duration = video_info['duration']
         fontsize = int(video_info['height'] * self.fontsize)
         line_width = video_info['height'] / self.num_lines
-        
-        longman = os.path.join(TEXT_DIR, "Longman_Communication_3000.txt")
-        tocfl = os.path.join(TEXT_DIR, "TOCFL_7517.txt")
-        ru = os.path.join(TEXT_DIR, "RU_10000.txt")
-
-        with open(tocfl, 'r', encoding="utf-8") as file:
-            chinese = file.read().splitlines()
-        with open(longman, 'r', encoding="utf-8") as file:
-            english = file.read().splitlines()
-        with open(ru, 'r', encoding="utf-8") as file:
-            russian = file.read().splitlines()
-        
-        # choose the most frequent 3000 words
-        chinese = chinese[:3000]
-        english = english[:3000]
-        russian = russian[:3000]
+
+        # seeded from the random module, so random.seed keeps the text reproducible
+        rng = np.random.default_rng(random.getrandbits(64))
+        # the language, scrolling speed and color of every line are drawn at once
+        languages = rng.integers(0, len(self.corpora), size=self.num_lines)
+        speeds = rng.uniform(0.4, 1.0, size=self.num_lines)
+        colors = rng.integers(0, 1 << 24, size=self.num_lines)
 
         text = []
-        for i in range(self.num_lines):
-            # tuple's second element is text length factor
-            corpus = random.choice([(chinese, 1.5), (english,0.8), (russian,0.7)])
-            text.append(" ".join(random.choices(corpus[0], k=ceil(duration*corpus[1]))))
+        for language in languages:
+            corpus, factor = self.corpora[language]
+            words = rng.integers(0, len(corpus), size=ceil(duration*factor))
+            text.append(" ".join(corpus[words].tolist()))
 
-        text_filters = []
+        # each line is overlaid as an image moving to the left
+        label = f"text{next(labels)}"
+        text_filters = [f"null[{label}v0]"]
         for i in range(self.num_lines):
-            speed = random.uniform(0.4, 1.0)
-            color = f"{random.randrange(16**6):06x}"
-            text_filter = f"drawtext=fontfile={self.font}:"\
-                + f"text='{text[i]}':"\
-                + f"fontcolor={color}@{self.opacity}:"\
-                + f"fontsize={fontsize}:"\
-                + f"box=1:"\
-                + f"boxcolor=black@{self.opacity * 0.2}:"\
-                + f"x=w-{speed}*100*t:"\
-                + f"y={i*line_width},"
-            text_filters.append(text_filter)
-        text_filters = "".join(text_filters)
+            text_filters.append(line_template.format(
+                image=self.render_line(text[i], fontsize, f"{colors[i]:06x}"),
+                label=label,
+                i=i,
+                speed=speeds[i],
+                y=i * line_width,
+                output=f"[{label}v{i + 1}]" if i < self.num_lines - 1 else "",
+            ))
+
+        return ";".join(text_filters)
 
+    def get_command(self, video_path: str, output_path: str) -> List[str]:
+        """
+        Overlays random text onto a video
+
+        @param video_path: the path to the video to be augmented
+
+        @param output_path: the path in which the resulting video will be stored.
+            If not passed in, the original video file will be overwritten
+
+        @returns: a list of strings containing the CLI FFMPEG command for
+            the augmentation
+        """
         filters = [
-            "-vf", text_filters
-            + "pad=width=ceil(iw/2)*2:height=ceil(ih/2)*2",
-            "-fps_mode", "cfr", # duplicate and drop frames for constant frame rate
-            "-r", str(video_info['r_frame_rate']),
+            "-filter_complex", self.get_filter_string(video_path)
+            + maybe_pad_even(video_path),
             "-c:a", "copy",
         ]
 
@@ -1,12 +1,31 @@
 from typing import List
 from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
+from augme.video.helpers import maybe_pad_even
 
 
 class VideoAugmenterByTransposition(BaseFFMPEGAugmenter):
+    changes_size = True
+
     def __init__(self, direction: float):
         assert direction in [0,1,2,3], "Valid direction is one of 0,1,2,3"
         
         self.direction = direction
+        self.filter_string = f"transpose={direction}"
+        self.gpu_filters = {
+            "cuda": f"transpose_npp=dir={direction}",
+            "qsv": f"vpp_qsv=transpose={direction}",
+        }
+
+    def get_filter_string(self, video_path: str) -> str:
+        """
+        Constructs the FFMPEG video filter chain that transposes the video
+
+        @param video_path: the path to the video to be augmented
+
+        @returns: a string containing the FFMPEG video filter chain for
+            the augmentation
+        """
+        return self.filter_string
 
     def get_command(self, video_path: str, output_path: str) -> List[str]:
         """
@@ -20,9 +39,13 @@ class VideoAugmenterByTransposition(BaseFFMPEGAugmenter):
         @returns: a list of strings containing the CLI FFMPEG command for
             the augmentation
         """
+        gpu_cmd = self.gpu_filter_fmt(video_path, self.gpu_filters, output_path)
+        if gpu_cmd:
+            return gpu_cmd
+
         filters = [
-            "-vf",  f"transpose={self.direction},"
-            + "pad=width=ceil(iw/2)*2:height=ceil(ih/2)*2",
+            "-vf",  self.get_filter_string(video_path)
+            + maybe_pad_even(video_path),
             "-c:a", "copy",
         ]
         
@@ -1,10 +1,12 @@
 from typing import List, Optional
 from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
-from augme.video.helpers import get_video_info
+from augme.video.helpers import get_video_info, maybe_pad_even
 
 
 class VideoAugmenterByTrim(BaseFFMPEGAugmenter):
-    def __init__(self, start: Optional[float] = None, end: Optional[float] = None):
+    def __init__(
+        self, start: Optional[float] = None, end: Optional[float] = None, fast: bool = False
+    ):
         assert start is None or start >= 0, "Start cannot be a negative number"
         assert (
             end is None or (start is not None and end > start) or end > 0
@@ -12,6 +14,7 @@ class VideoAugmenterByTrim(BaseFFMPEGAugmenter):
 
         self.start = start
         self.end = end
+        self.fast = fast
 
 
     def get_command(self, video_path: str, output_path: str) -> List[str]:
@@ -25,21 +28,36 @@ class VideoAugmenterByTrim(BaseFFMPEGAugmenter):
         @returns: a list of strings containing the CLI FFMPEG command for
             the augmentation
         """
-        video_info = get_video_info(video_path)
-
-        if self.start is None:
-            self.start = 0
-        if self.end is None:
-            self.end = video_info["duration"]
-
-        duration = self.end - self.start
+        # the augmenter may be applied to several videos, so the defaults
+        # aren't stored on it
+        start = self.start or 0
+        end = self.end
+        if end is None:
+            end = get_video_info(video_path)["duration"]
+
+        duration = end - start
+        pad = maybe_pad_even(video_path)
+
+        if self.fast and not pad:
+            # nothing to pad, so the cut is rewrapped without re-encoding.
+            # The cut then starts on the keyframe before the start timestamp
+            return [
+                "-y",
+                "-ss", str(start),
+                "-i", video_path,
+                "-t", str(duration),
+                "-map", "0",
+                "-c", "copy",
+                "-avoid_negative_ts", "make_zero",
+                *self.container_fmt(output_path),
+            ]
 
         return [
             "-y", # overwrite existing
-            "-ss", str(self.start), # start timestamp of the cut, put before input for better performance
+            "-ss", str(start), # start timestamp of the cut, put before input for better performance
             "-i", video_path, # input video
             "-t", str(duration), # duration of the cut counting from start timestamp
-            "-vf", "pad=width=ceil(iw/2)*2:height=ceil(ih/2)*2",
+            *(["-vf", pad.lstrip(",")] if pad else []),
             "-c:a", "copy",
             *self.output_fmt(output_path),
         ]
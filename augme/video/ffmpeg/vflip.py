@@ -1,8 +1,23 @@
 from typing import List
 from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
+from augme.video.helpers import maybe_pad_even
 
 
 class VideoAugmenterByVFlip(BaseFFMPEGAugmenter):
+    # CUDA has no flip filter, so only QSV flips on the GPU
+    gpu_filters = {"qsv": "vpp_qsv=transpose=vflip"}
+
+    def get_filter_string(self, video_path: str) -> str:
+        """
+        Constructs the FFMPEG video filter chain that vertically flips the video
+
+        @param video_path: the path to the video to be augmented
+
+        @returns: a string containing the FFMPEG video filter chain for
+            the augmentation
+        """
+        return "vflip"
+
     def get_command(self, video_path: str, output_path: str) -> List[str]:
         """
         Vertically flips the video
@@ -14,9 +29,13 @@ class VideoAugmenterByVFlip(BaseFFMPEGAugmenter):
         @returns: a list of strings containing the CLI FFMPEG command for
             the augmentation
         """
+        gpu_cmd = self.gpu_filter_fmt(video_path, self.gpu_filters, output_path)
+        if gpu_cmd:
+            return gpu_cmd
+
         filters = [
-            "-vf", "vflip,"
-            + "pad=width=ceil(iw/2)*2:height=ceil(ih/2)*2",
+            "-vf", self.get_filter_string(video_path)
+            + maybe_pad_even(video_path),
             "-c:a", "copy",
         ]
         
@@ -4,12 +4,21 @@ from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
 from augme.video.helpers import (
     get_video_info,
     get_audio_info,
+    get_frame_bytes,
     validate_path,
     validate_rgb_color,
 )
 
+# a second video whose decoded frames fit in this many bytes is decoded once
+# and looped in memory, rather than demuxed and decoded again on every loop
+max_loop_bytes = 256 * 1024 ** 2
+# the most frames FFMPEG's loop filter can hold
+max_loop_frames = 32767
+
 
 class VideoAugmenterByVStack(BaseFFMPEGAugmenter):
+    changes_size = True
+
     def __init__(
         self,
         second_video_path: str,
@@ -31,8 +40,24 @@ class VideoAugmenterByVStack(BaseFFMPEGAugmenter):
         self.preserve_aspect_ratio = preserve_aspect_ratio
         self.pad_second_video = pad_second_video
         self.hex_color = "%02x%02x%02x" % pad_color
+        # centres the second video on a canvas of the pad color
+        self.center_pad = f":x=(ow-iw)/2:y=(oh-ih)/2:color={self.hex_color}"
         self.max_height = max_height
 
+        # the second video is fitted to the first one, whose dimensions are
+        # only filled in once it's probed
+        scale_height = "-1" if preserve_aspect_ratio else "{height}"
+        pad = "pad=w={width}:h={height}" + self.center_pad
+        self.scale_template = "scale=w={width}:h=" + scale_height + "[1v];"
+        self.pad_template = f"[1v]{pad}[vpad];" if pad_second_video else "[1v]null[vpad];"
+        self.scale_pad_template = "[1v]scale=w=-1:h={height}[1scale];" \
+            + f"[1scale]{pad}[vpad];"
+
+        # the end of the filter graph only depends on the constructor arguments
+        stack_order = "[vpad][0v]" if target_grid else "[0v][vpad]"
+        self.stack_filter = f"{stack_order}vstack=inputs=2[vstack];" \
+            + f"[vstack]scale=w=-1:h='min(ih,{max_height})',setsar=ratio=1:1[vscale];" \
+            + "[vscale]pad=w=ceil(iw/2)*2:h=ceil(ih/2)*2[v]" # ensure divisible by 2
 
     def get_command(self, video_path: str, output_path: str) -> List[str]:
         """
@@ -57,7 +82,7 @@ class VideoAugmenterByVStack(BaseFFMPEGAugmenter):
         audio_filter = ""
         audio_codec = ["-c:a", "copy",]
         if (self.merge_audio and audio_info and second_audio_info):
-            audio_filter = ";[0:a:0][1:a:0]amerge=inputs=2,pan=stereo|c0<c0+c2|c1<c1+c3[a]"
+            audio_filter = ";[0:a:0][1:a:0]amix=inputs=2:duration=shortest:normalize=0[a]"
             audio_map = ["-map",  "[a]",]
             audio_codec = [
                 "-c:a", "aac", # audio encoder
@@ -70,39 +95,51 @@ class VideoAugmenterByVStack(BaseFFMPEGAugmenter):
         else:
             audio_map = ["-map", "0:a?",]
 
-        if self.target_grid:
-            stack_order = "[vpad][0:v:0]"
+        # the decoded frames can only be looped when the second video's audio
+        # isn't used, since the audio would have to be looped as well
+        fps = second_video_info['avg_frame_rate']
+        second_frames = ceil(second_video_info['duration'] * fps) + 1
+        frame_bytes = get_frame_bytes(second_video_info)
+        if (
+            fps > 0
+            and second_frames <= max_loop_frames
+            and second_frames * frame_bytes <= max_loop_bytes
+            and not (self.merge_audio and second_audio_info)
+        ):
+            second_input = ["-i", self.second_video_path]
+            second_video = f"[1:v:0]loop=loop={n_loops}:size={second_frames}:start=0," \
+                + "setpts=N/FRAME_RATE/TB,"
         else:
-            stack_order = "[0:v:0][vpad]"
-
-        if self.preserve_aspect_ratio:
-            scale_height = "-1"
+            second_input = ["-stream_loop", str(n_loops), "-i", self.second_video_path]
+            second_video = "[1:v:0]"
+
+        # an odd-sized main video is padded to even dimensions within the graph,
+        # and the second video is fitted to the padded size
+        width = ceil(video_info['width'] / 2) * 2
+        height = ceil(video_info['height'] / 2) * 2
+        if (width, height) != (video_info['width'], video_info['height']):
+            main_filter = f"[0:v:0]pad=w={width}:h={height}[0v];"
         else:
-            scale_height = video_info['height']
+            main_filter = "[0:v:0]null[0v];"
 
-        if (self.pad_second_video and (video_info['height'] < video_info['width'] / second_video_info['width'] * second_video_info['height'])):
-            pad_filter = f"[1v]scale=w=-1:h={video_info['height']}[1scale];"\
-                + f"[1scale]pad=w={video_info['width']}:h={video_info['height']}:x=(ow-iw)/2:y=(oh-ih)/2:color={self.hex_color}[vpad];"
-        elif self.pad_second_video:
-            pad_filter = f"[1v]pad=w={video_info['width']}:h={video_info['height']}:x=(ow-iw)/2:y=(oh-ih)/2:color={self.hex_color}[vpad];"
-        else:
-            pad_filter = f"[1v]null[vpad];"
+        size = {"width": width, "height": height}
+        pad_template = self.pad_template
+        if (self.pad_second_video and (height < width / second_video_info['width'] * second_video_info['height'])):
+            pad_template = self.scale_pad_template
 
         filters = [
-            "-stream_loop", str(n_loops),
-            "-i", self.second_video_path,
+            *second_input,
             "-t", f"{video_info['duration']}",
             "-filter_complex",
-            f"[1:v:0]scale=w={video_info['width']}:h={scale_height}[1v];"
-            + pad_filter
-            + f"{stack_order}vstack=inputs=2[vstack];"
-            + f"[vstack]scale=w=-1:h='min(ih,{self.max_height})',setsar=ratio=1:1[vscale];"
-            + f"[vscale]pad=w=ceil(iw/2)*2:h=ceil(ih/2)*2[v]" # ensure divisible by 2
-            + audio_filter,
+            "".join([
+                main_filter,
+                second_video + self.scale_template.format(**size),
+                pad_template.format(**size),
+                self.stack_filter,
+                audio_filter,
+            ]),
             "-map", "[v]",
             *audio_map,
-            "-fps_mode", "cfr", # duplicate and drop frames for constant frame rate
-            "-r", str(video_info['r_frame_rate']),
             *audio_codec,
         ]
 
@@ -11,16 +11,27 @@ from augme.video.helpers.utils import (
 
 from augme.video.helpers.ffmpeg import (
     execute_ffmpeg_cmd,
+    execute_ffmpeg_cmd_async,
+    execute_ffmpeg_cmds,
+    execute_ffmpeg_pipe,
     execute_ffprobe_cmd,
+    clear_probe_cache,
+    get_filters,
+    get_hwaccels,
+    get_media_info,
     get_video_info,
     get_audio_info,
+    get_frame_bytes,
     get_precise_duration,
+    maybe_pad_even,
+    prefetch_media_info,
     extract_frames,
 )
 
 from augme.video.helpers.metadata import (
     get_func_kwargs,
     get_metadata,
+    finalize_metadata,
 )
 
 from augme.video.helpers.constants import (
@@ -53,14 +64,25 @@ __all__ = [
     "select_random_font",
     # -- ffmpeg --
     "execute_ffmpeg_cmd",
+    "execute_ffmpeg_cmd_async",
+    "execute_ffmpeg_cmds",
+    "execute_ffmpeg_pipe",
     "execute_ffprobe_cmd",
+    "clear_probe_cache",
+    "get_filters",
+    "get_hwaccels",
+    "get_media_info",
     "get_video_info",
     "get_audio_info",
+    "get_frame_bytes",
     "get_precise_duration",
+    "maybe_pad_even",
+    "prefetch_media_info",
     "extract_frames",
     # -- metadata --
     "get_func_kwargs",
     "get_metadata",
+    "finalize_metadata",
     # -- constants --
     "ASSETS_BASE_DIR",
     "AUDIO_ASSETS_DIR",
@@ -1,9 +1,14 @@
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from math import ceil
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple, Union
 import json
 import re
 import os
+import time
 from pathlib import Path
 
 
@@ -11,20 +16,102 @@ FFMPEG_PATH = ffmpeg = shutil.which('ffmpeg')
 FFPROBE_PATH = shutil.which('ffprobe')
 
 
-def execute_ffmpeg_cmd(cmd, timeout=3600):
+def execute_ffmpeg_cmd(cmd, timeout=3600) -> int:
+    process = execute_ffmpeg_cmd_async(cmd)
+    try:
+        (stdout, stderr) = process.communicate(input=None, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+    return process.returncode
+
+
+def execute_ffmpeg_cmd_async(cmd) -> subprocess.Popen:
+    """
+    Starts an FFMPEG command without waiting for it to finish
+
+    @param cmd: a list of strings containing the CLI FFMPEG command
+
+    @returns: the handle of the running FFMPEG process, call its wait method
+        to wait for the command to finish
+    """
     cmd.insert(0, FFMPEG_PATH)
     print(*cmd)
 
-    process = subprocess.Popen(
+    return subprocess.Popen(
         cmd,
         bufsize=1,
         text=True,
         encoding='utf-8'
     )
-    try:
-        (stdout, stderr) = process.communicate(input=None, timeout=timeout)
-    except subprocess.TimeoutExpired:
-        process.kill()
+
+
+def execute_ffmpeg_pipe(cmds: List[List[str]]) -> List[int]:
+    """
+    Runs FFMPEG commands at the same time, feeding the standard output of each
+    command to the standard input of the next one
+
+    @param cmds: a list of CLI FFMPEG commands, each a list of strings. All but
+        the last one must write to pipe:1, all but the first read from pipe:0
+
+    @returns: the FFMPEG return codes, in the order of the commands
+    """
+    processes = []
+    for i, cmd in enumerate(cmds):
+        cmd.insert(0, FFMPEG_PATH)
+        print(*cmd)
+
+        process = subprocess.Popen(
+            cmd,
+            stdin=processes[-1].stdout if processes else None,
+            stdout=subprocess.PIPE if i < len(cmds) - 1 else None,
+        )
+        if processes:
+            # only the next command holds the pipe, so the previous one stops
+            # if the next one fails
+            processes[-1].stdout.close()
+        processes.append(process)
+
+    return [process.wait() for process in processes]
+
+
+def execute_ffmpeg_cmds(
+    cmds: List[List[str]], max_parallel: Optional[int] = None
+) -> List[int]:
+    """
+    Runs independent FFMPEG commands concurrently, starting a new one as soon
+    as a running one finishes
+
+    @param cmds: a list of CLI FFMPEG commands, each a list of strings
+
+    @param max_parallel: the maximum number of FFMPEG processes running at
+        once. If not passed in, the number of CPU cores is used
+
+    @returns: the FFMPEG return codes, in the order of the commands
+    """
+    max_parallel = max_parallel or os.cpu_count() or 1
+    assert max_parallel > 0, "The number of parallel commands must be positive"
+
+    returncodes = [None] * len(cmds)
+    running = {}
+    pending = iter(enumerate(cmds))
+
+    while True:
+        while len(running) < max_parallel:
+            index, cmd = next(pending, (None, None))
+            if cmd is None:
+                break
+            running[index] = execute_ffmpeg_cmd_async(cmd)
+
+        if not running:
+            return returncodes
+
+        finished = [i for i, process in running.items() if process.poll() is not None]
+        for index in finished:
+            returncodes[index] = running.pop(index).returncode
+        if not finished:
+            time.sleep(0.05)
 
 
 def execute_ffprobe_cmd(cmd, timeout=30):
@@ -69,6 +156,41 @@ def execute_ffmpeg_capture_cmd(cmd, timeout=3600):
     return result
 
 
+@lru_cache(maxsize=1)
+def get_hwaccels() -> Tuple[str, ...]:
+    """
+    Lists the hardware acceleration methods the installed FFMPEG supports.
+    FFMPEG is only queried the first time, the result is then reused
+
+    @returns: the names of the hardware acceleration methods, e.g. "cuda"
+    """
+    if FFMPEG_PATH is None:
+        return ()
+
+    result = execute_ffmpeg_capture_cmd(['-hide_banner', '-hwaccels'])
+    # the methods are listed one per line after the header line
+    lines = [line.strip() for line in result.stdout.splitlines()]
+    return tuple(line for line in lines[1:] if line)
+
+
+@lru_cache(maxsize=1)
+def get_filters() -> Tuple[str, ...]:
+    """
+    Lists the filters the installed FFMPEG was built with, e.g. to check for
+    the GPU filters. FFMPEG is only queried the first time, the result is
+    then reused
+
+    @returns: the names of the filters
+    """
+    if FFMPEG_PATH is None:
+        return ()
+
+    result = execute_ffmpeg_capture_cmd(['-hide_banner', '-filters'])
+    # each filter line reads "<flags> <name> <inputs>-><outputs> <description>"
+    parts = [line.split() for line in result.stdout.splitlines()]
+    return tuple(p[1] for p in parts if len(p) > 2 and "->" in p[2])
+
+
 def get_video_fps(frame_rate: str) -> Optional[float]:
     try:
         # ffmpeg often returns fractional framerates, e.g. 225480/7523
@@ -114,6 +236,68 @@ def get_media_info(
         List[Optional[Dict[str, Any]]],
         List[Optional[Dict[str, Any]]],
     ]:
+    # callers are free to modify the returned streams
+    return deepcopy(lookup_media_info(input_file))
+
+
+def lookup_media_info(
+        input_file: str
+    ) -> Tuple[
+        List[Optional[Dict[str, Any]]],
+        List[Optional[Dict[str, Any]]],
+        List[Optional[Dict[str, Any]]],
+    ]:
+    # the cache is keyed on the file's modification time and size, so a file
+    # overwritten by an augmentation is probed again. The result is shared
+    # with later lookups, so it must not be modified
+    try:
+        stat = os.stat(input_file)
+    except OSError:
+        return probe_media_info(input_file)
+
+    return cached_media_info(
+        os.path.realpath(input_file), stat.st_mtime_ns, stat.st_size
+    )
+
+
+@lru_cache(maxsize=1024)
+def cached_media_info(
+        input_file: str, mtime_ns: int, size: int
+    ) -> Tuple[
+        List[Optional[Dict[str, Any]]],
+        List[Optional[Dict[str, Any]]],
+        List[Optional[Dict[str, Any]]],
+    ]:
+    return probe_media_info(input_file)
+
+
+def prefetch_media_info(input_files: List[str], max_workers: int = 4) -> None:
+    """
+    Probes several files concurrently and caches the results, so that their
+    following lookups don't run ffprobe one file after another
+
+    @param input_files: the paths to the files to be probed
+
+    @param max_workers: the maximum number of ffprobe processes running at once
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(lookup_media_info, input_files))
+
+
+def clear_probe_cache() -> None:
+    """
+    Drops every cached ffprobe result, so the next lookups probe the files again
+    """
+    cached_media_info.cache_clear()
+
+
+def probe_media_info(
+        input_file: str
+    ) -> Tuple[
+        List[Optional[Dict[str, Any]]],
+        List[Optional[Dict[str, Any]]],
+        List[Optional[Dict[str, Any]]],
+    ]:
     video_metadata = []
     audio_metadata = []
     subtitle_metadata = []
@@ -122,6 +306,7 @@ def get_media_info(
         '-v', 'quiet', # produce only minimal output
         '-print_format', 'json',  # print output in JSON format
         '-show_streams', #  display detailed information about the selected streams
+        '-show_format', # the container duration, for streams that don't have their own
         input_file
     ]
     result = execute_ffprobe_cmd(cmd)
@@ -143,25 +328,79 @@ def get_media_info(
                 s for s in output_json['streams'] if s['codec_type'] == 'subtitle'
             ]
 
+            # matroska and webm streams don't carry a duration, so the container's
+            # is used before falling back to decoding the whole file
+            format_duration = float(output_json.get('format', {}).get('duration', 0))
+
             # Convert fraction to decimal point representation of frame rates
             for stream in video_metadata:
                 avg_frame_rate = stream.get('avg_frame_rate', 0)
                 stream['avg_frame_rate'] = get_video_fps(avg_frame_rate)
                 r_frame_rate = stream.get('r_frame_rate', 0)
                 stream['r_frame_rate'] = get_video_fps(r_frame_rate)
-                stream['duration'] = float(stream.get('duration', 0)) or get_precise_duration(input_file)
+                stream['duration'] = float(stream.get('duration', 0)) or format_duration \
+                    or get_precise_duration(input_file)
 
     return (video_metadata, audio_metadata, subtitle_metadata)
 
 def get_video_info(input_file: str) -> Optional[Dict[str, Any]]:
-    (video_metadata, audio_metadata, subtitle_metadata) = get_media_info(input_file)
+    (video_metadata, audio_metadata, subtitle_metadata) = lookup_media_info(input_file)
     if len(video_metadata) > 0:
-        return video_metadata[0]
+        # only copy the stream that is returned
+        return deepcopy(video_metadata[0])
 
 def get_audio_info(input_file: str) -> Optional[Dict[str, Any]]:
-    (video_metadata, audio_metadata, subtitle_metadata) = get_media_info(input_file)
+    (video_metadata, audio_metadata, subtitle_metadata) = lookup_media_info(input_file)
     if len(audio_metadata) > 0:
-        return audio_metadata[0]
+        return deepcopy(audio_metadata[0])
+
+def maybe_pad_even(video_path: str) -> str:
+    """
+    Returns the pad filter that rounds the video dimensions up to even numbers,
+    as required by the yuv420p encoders, only if the video actually has an
+    odd width or height
+
+    @param video_path: the path to the video to be augmented
+
+    @returns: the pad filter prefixed with a comma, so it can be appended to
+        a filter chain, or an empty string if the dimensions are already even
+    """
+    video_info = get_video_info(video_path)
+    if video_info and not (video_info["width"] % 2 or video_info["height"] % 2):
+        return ""
+
+    return ",pad=width=ceil(iw/2)*2:height=ceil(ih/2)*2"
+
+def get_frame_bytes(video_info: Dict[str, Any]) -> int:
+    """
+    Estimates the size of a decoded frame of the video from its pixel format,
+    erring on the large side for the formats that aren't recognized
+
+    @param video_info: the video stream info returned by `get_video_info`
+
+    @returns: the number of bytes of a decoded frame
+    """
+    pix_fmt = video_info.get("pix_fmt") or ""
+    if pix_fmt.startswith("gray"):
+        bytes_per_pixel = 1
+    elif any(sub in pix_fmt for sub in ("420", "411", "410", "nv12", "nv21", "p010", "p016")):
+        bytes_per_pixel = 1.5
+    elif any(sub in pix_fmt for sub in ("422", "440", "nv16", "yuyv", "uyvy")):
+        bytes_per_pixel = 2
+    elif pix_fmt in ("yuv444p", "yuvj444p", "gbrp", "rgb24", "bgr24") or (
+        pix_fmt.startswith(("yuv444p", "gbrp")) and pix_fmt.endswith(("le", "be"))
+    ):
+        bytes_per_pixel = 3
+    else:
+        bytes_per_pixel = 4
+
+    # the formats deeper than 8 bits store every sample in 2 bytes
+    if pix_fmt.endswith(("le", "be")) or any(
+        depth in pix_fmt for depth in ("p9", "p10", "p12", "p14", "p16", "010")
+    ):
+        bytes_per_pixel *= 2
+
+    return ceil(video_info["width"] * video_info["height"] * bytes_per_pixel)
 
 def extract_frames(
     video_path: str,
@@ -1,7 +1,15 @@
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import deepcopy
 from typing import Any, Dict, List, Optional
 from augme.video import helpers
 
+# with the AUGME_ASYNC_METADATA environment variable set, the output videos are
+# probed in the background; the metadata entries are appended in order and
+# filled in once their probe finishes
+metadata_executor = ThreadPoolExecutor(max_workers=4)
+pending_metadata: List[Future] = []
+
 
 def get_func_kwargs(
     metadata: Optional[List[Dict[str, Any]]],
@@ -11,8 +19,11 @@ def get_func_kwargs(
 ) -> Dict[str, Any]:
     if metadata is None:
         return {}
-    func_kwargs = deepcopy(local_kwargs)
-    func_kwargs.pop("metadata")
+    # the metadata list grows with every augmentation it records, so it is
+    # left out before the arguments are copied
+    func_kwargs = deepcopy(
+        {key: value for key, value in local_kwargs.items() if key != "metadata"}
+    )
     video_info = helpers.get_video_info(video_path)
     func_kwargs.update(
         {
@@ -37,6 +48,26 @@ def get_metadata(
         metadata, list
     ), "Expected 'metadata' to be set to None or of type list"
 
+    if os.environ.get("AUGME_ASYNC_METADATA"):
+        entry = {}
+        metadata.append(entry)
+        pending_metadata.append(metadata_executor.submit(
+            lambda: entry.update(build_metadata(
+                function_name, video_path, output_path, src_video_info, **kwargs
+            ))
+        ))
+    else:
+        metadata.append(build_metadata(
+            function_name, video_path, output_path, src_video_info, **kwargs
+        ))
+
+def build_metadata(
+    function_name: str,
+    video_path: str,
+    output_path: Optional[str],
+    src_video_info: Dict[str, Any],
+    **kwargs,
+) -> Dict[str, Any]:
     # Output video may not be provided
     output_path = output_path or video_path
     dst_video_info = helpers.get_video_info(output_path)
@@ -48,18 +79,23 @@ def get_metadata(
         (k, list(v)) if isinstance(v, tuple) else (k, v) for k, v in kwargs.items()
     )
 
-    metadata.append(
-        {
-            "name": function_name,
-            "src_duration": src_video_info["duration"],
-            "dst_duration": dst_video_info["duration"],
-            "src_fps": src_video_info["r_frame_rate"],
-            "dst_fps": dst_video_info["r_frame_rate"],
-            "src_width": src_video_info["width"],
-            "src_height": src_video_info["height"],
-            "dst_width": dst_video_info["width"],
-            "dst_height": dst_video_info["height"],
-            **kwargs_types_fixed,
-        }
-    )
+    return {
+        "name": function_name,
+        "src_duration": src_video_info["duration"],
+        "dst_duration": dst_video_info["duration"],
+        "src_fps": src_video_info["r_frame_rate"],
+        "dst_fps": dst_video_info["r_frame_rate"],
+        "src_width": src_video_info["width"],
+        "src_height": src_video_info["height"],
+        "dst_width": dst_video_info["width"],
+        "dst_height": dst_video_info["height"],
+        **kwargs_types_fixed,
+    }
 
+def finalize_metadata() -> None:
+    """
+    Waits until the metadata entries that are filled in the background, when
+    the AUGME_ASYNC_METADATA environment variable is set, are complete
+    """
+    while pending_metadata:
+        pending_metadata.pop(0).result()
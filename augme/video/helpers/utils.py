@@ -70,9 +70,26 @@ def resize_image(
     height: Optional[int] = None,
     resample: Any = Image.BILINEAR,
 ) -> Image.Image:
-    
-    validate_path(image)
-    image = Image.open(image)
+    """
+    Resize an image
+
+    @param image: the path to an image or a variable of type PIL.Image.Image
+        to be augmented
+
+    @param output_path: the path in which the resulting image will be stored.
+        If None, the resulting PIL Image will still be returned
+
+    @param width: the width of the resized image. If None, it is left as is
+
+    @param height: the height of the resized image. If None, it is left as is
+
+    @param resample: the PIL resampling filter
+
+    @returns: the augmented PIL Image
+    """
+    if not isinstance(image, Image.Image):
+        validate_path(image)
+        image = Image.open(image)
     src_mode = image.mode
     im_w, im_h = image.size
     aug_image = image.resize((width or im_w, height or im_h), resample)
@@ -90,6 +107,8 @@ def resize_image(
 
         aug_image.save(output_path)
 
+    return aug_image
+
 
 def opacity_image(
     image: Union[str, Image.Image],
@@ -112,8 +131,9 @@ def opacity_image(
     """
     assert 0 <= level <= 1, "level must be a value in the range [0, 1]"
 
-    validate_path(image)
-    image = Image.open(image)
+    if not isinstance(image, Image.Image):
+        validate_path(image)
+        image = Image.open(image)
     src_mode = image.mode
 
     image = image.convert(mode="RGBA")
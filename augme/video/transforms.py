@@ -1,6 +1,8 @@
 import os
 import random
 from typing import Any, Callable, Dict, List, Optional, Tuple
+from augme.video import ffmpeg as af
+from augme.video.ffmpeg.base_augmenter import BaseFFMPEGAugmenter
 from augme.video import functional as F
 from augme.video import helpers
 
@@ -71,6 +73,14 @@ class BaseTransform(VidAugBaseClass):
         """
         raise NotImplementedError()
 
+    def get_augmenter(self) -> BaseFFMPEGAugmenter:
+        """
+        This function can be implemented in the child classes whose
+        augmentation is a plain video filter chain, so that Compose can run
+        it together with neighbouring transforms in a single FFMPEG run
+        """
+        raise NotImplementedError()
+
 
 class AddNoise(BaseTransform):
     def __init__(
@@ -240,14 +250,19 @@ class BlendVideos(BaseTransform):
 
 
 class Blur(BaseTransform):
-    def __init__(self, sigma: float = 1.0, p: float = 1.0):
+    def __init__(self, sigma: float = 1.0, exact: bool = False, p: float = 1.0):
         """
         @param sigma: horizontal sigma, standard deviation of Gaussian blur
 
+        @param exact: if set to False, a sigma above 3 is approximated by three
+            box blurs, which is much faster. If set to True, the Gaussian blur is
+            always used
+
         @param p: the probability of the transform being applied; default value is 1.0
         """
         super().__init__(p)
         self.sigma = sigma
+        self.exact = exact
 
     def apply_transform(
         self,
@@ -269,7 +284,15 @@ class Blur(BaseTransform):
 
         @returns: the path to the augmented video
         """
-        return F.blur(video_path, output_path, self.sigma, metadata=metadata)
+        return F.blur(
+            video_path, output_path, self.sigma, self.exact, metadata=metadata
+        )
+
+    def get_augmenter(self) -> BaseFFMPEGAugmenter:
+        """
+        @returns: the augmenter that blurs a video
+        """
+        return af.VideoAugmenterByBlur(float(self.sigma), bool(self.exact))
 
 
 class Brightness(BaseTransform):
@@ -310,6 +333,12 @@ class Brightness(BaseTransform):
             metadata=metadata,
         )
 
+    def get_augmenter(self) -> BaseFFMPEGAugmenter:
+        """
+        @returns: the augmenter that brightens or darkens a video
+        """
+        return af.VideoAugmenterByBrightness(float(self.level))
+
 
 class ChangeAspectRatio(BaseTransform):
     def __init__(self, ratio: float = 1.0, p: float = 1.0):
@@ -383,6 +412,12 @@ class ChangeVideoSpeed(BaseTransform):
             video_path, output_path, self.factor, metadata=metadata
         )
 
+    def get_augmenter(self) -> BaseFFMPEGAugmenter:
+        """
+        @returns: the augmenter that changes the speed of a video
+        """
+        return af.VideoAugmenterBySpeed(float(self.factor))
+
 
 class ColorJitter(BaseTransform):
     def __init__(
@@ -438,6 +473,76 @@ class ColorJitter(BaseTransform):
             metadata=metadata,
         )
 
+    def get_augmenter(self) -> BaseFFMPEGAugmenter:
+        """
+        @returns: the augmenter that color jitters the video
+        """
+        return af.VideoAugmenterByColorJitter(
+            float(self.brightness_factor),
+            float(self.contrast_factor),
+            float(self.saturation_factor),
+        )
+
+
+class Compose(BaseTransform):
+    def __init__(self, transforms: List[BaseTransform], p: float = 1.0):
+        """
+        @param transforms: the transforms to be applied, in order. Each one is
+            still applied according to its own probability
+
+        @param p: the probability of the transform being applied; default value is 1.0
+        """
+        super().__init__(p)
+        self.transforms = transforms
+
+    def apply_transform(
+        self,
+        video_path: str,
+        output_path: str,
+        metadata: Optional[List[Dict[str, Any]]] = None,
+    ) -> str:
+        """
+        Applies the transforms one after another. Consecutive transforms that
+        are plain video filter chains share a single FFMPEG run up to a change
+        of dimensions, with the brightness, contrast and color jitter ones fused
+        into a single eq filter
+
+        @param video_path: the path to the video to be augmented
+
+        @param output_path: the path in which the resulting video will be stored.
+            If not passed in, the original video file will be overwritten
+
+        @param metadata: if set to be a list, metadata about the function execution
+            including its name, the source & dest duration, fps, etc. will be appended
+            to the inputted list. If set to None, no metadata will be appended or returned
+
+        @returns: the path to the augmented video
+        """
+        transforms = [t for t in self.transforms if random.random() <= t.p]
+
+        # group runs of filter chain transforms, keep the others on their own
+        groups: List[Any] = []
+        for transform in transforms:
+            try:
+                augmenter = transform.get_augmenter()
+            except NotImplementedError:
+                groups.append(transform)
+                continue
+
+            if groups and isinstance(groups[-1], list):
+                groups[-1].append(augmenter)
+            else:
+                groups.append([augmenter])
+
+        for group in groups:
+            if isinstance(group, list):
+                F.compose(video_path, group, output_path, metadata=metadata)
+            else:
+                group(video_path, output_path, force=True, metadata=metadata)
+            video_path = output_path
+
+        return video_path
+
 
 class Concat(BaseTransform):
     def __init__(
@@ -529,6 +634,12 @@ class Contrast(BaseTransform):
         """
         return F.contrast(video_path, output_path, self.level, metadata=metadata)
 
+    def get_augmenter(self) -> BaseFFMPEGAugmenter:
+        """
+        @returns: the augmenter that alters the contrast of a video
+        """
+        return af.VideoAugmenterByContrast(float(self.level))
+
 
 class Crop(BaseTransform):
     def __init__(
@@ -587,6 +698,14 @@ class Crop(BaseTransform):
             metadata=metadata,
         )
 
+    def get_augmenter(self) -> BaseFFMPEGAugmenter:
+        """
+        @returns: the augmenter that crops a video
+        """
+        return af.VideoAugmenterByCrop(
+            float(self.left), float(self.top), float(self.right), float(self.bottom)
+        )
+
 
 class Emboss(BaseTransform):
     def apply_transform(
@@ -615,6 +734,12 @@ class Emboss(BaseTransform):
             metadata=metadata,
         )
 
+    def get_augmenter(self) -> BaseFFMPEGAugmenter:
+        """
+        @returns: the augmenter that embosses a video
+        """
+        return af.VideoAugmenterByEmboss()
+
 
 class EncodingQuality(BaseTransform):
     def __init__(self, quality: int = 23, p: float = 1.0):
@@ -656,6 +781,77 @@ class EncodingQuality(BaseTransform):
         )
 
 
+class Eq(BaseTransform):
+    def __init__(
+        self,
+        brightness: float = 0.0,
+        contrast: float = 1.0,
+        saturation: float = 1.0,
+        gamma: float = 1.0,
+        p: float = 1.0,
+    ):
+        """
+        @param brightness: the value must be a float value in range -1.0 to 1.0,
+            where a negative value darkens and positive brightens
+
+        @param contrast: the value must be a float value in range -1000.0 to 1000.0,
+            where a negative value removes contrast and a positive value adds contrast
+
+        @param saturation: the value must be a float value in range 0.0 to 3.0
+
+        @param gamma: the value must be a float value in range 0.1 to 10.0
+
+        @param p: the probability of the transform being applied; default value is 1.0
+        """
+        super().__init__(p)
+        self.brightness = brightness
+        self.contrast = contrast
+        self.saturation = saturation
+        self.gamma = gamma
+
+    def apply_transform(
+        self,
+        video_path: str,
+        output_path: str,
+        metadata: Optional[List[Dict[str, Any]]] = None,
+    ) -> str:
+        """
+        Alters the brightness, contrast, saturation and gamma of a video
+
+        @param video_path: the path to the video to be augmented
+
+        @param output_path: the path in which the resulting video will be stored.
+            If not passed in, the original video file will be overwritten
+
+        @param metadata: if set to be a list, metadata about the function execution
+            including its name, the source & dest duration, fps, etc. will be appended
+            to the inputted list. If set to None, no metadata will be appended or returned
+
+        @returns: the path to the augmented video
+        """
+        return F.eq(
+            video_path,
+            output_path,
+            self.brightness,
+            self.contrast,
+            self.saturation,
+            self.gamma,
+            metadata=metadata,
+        )
+
+    def get_augmenter(self) -> BaseFFMPEGAugmenter:
+        """
+        @returns: the augmenter that alters the brightness, contrast,
+            saturation and gamma of a video
+        """
+        return af.VideoAugmenterByEq(
+            float(self.brightness),
+            float(self.contrast),
+            float(self.saturation),
+            float(self.gamma),
+        )
+
+
 class FPS(BaseTransform):
     def __init__(self, fps: int = 15, p: float = 1.0):
         """
@@ -689,6 +885,12 @@ class FPS(BaseTransform):
         """
         return F.fps(video_path, output_path, self.fps, metadata=metadata)
 
+    def get_augmenter(self) -> BaseFFMPEGAugmenter:
+        """
+        @returns: the augmenter that changes the frame rate of a video
+        """
+        return af.VideoAugmenterByFPSChange(int(self.fps))
+
 
 class FStack(BaseTransform):
     def __init__(
@@ -809,8 +1011,24 @@ class Gradient(BaseTransform):
             metadata=metadata,
         )
 
+    def get_augmenter(self) -> BaseFFMPEGAugmenter:
+        """
+        @returns: the augmenter that overlays a gradient onto a video
+        """
+        return af.VideoAugmenterByGradient()
+
 
 class Grayscale(BaseTransform):
+    def __init__(self, method: str = "format", p: float = 1.0):
+        """
+        @param method: "format" drops the chroma planes, which is the fastest;
+            "hue" desaturates the video with the hue filter instead
+
+        @param p: the probability of the transform being applied; default value is 1.0
+        """
+        super().__init__(p)
+        self.method = method
+
     def apply_transform(
         self,
         video_path: str,
@@ -831,7 +1049,13 @@ class Grayscale(BaseTransform):
 
         @returns: the path to the augmented video
         """
-        return F.grayscale(video_path, output_path, metadata=metadata)
+        return F.grayscale(video_path, output_path, self.method, metadata=metadata)
+
+    def get_augmenter(self) -> BaseFFMPEGAugmenter:
+        """
+        @returns: the augmenter that changes a video to be grayscale
+        """
+        return af.VideoAugmenterByGrayscale(self.method)
 
 
 class HFlip(BaseTransform):
@@ -857,6 +1081,12 @@ class HFlip(BaseTransform):
         """
         return F.hflip(video_path, output_path, metadata=metadata)
 
+    def get_augmenter(self) -> BaseFFMPEGAugmenter:
+        """
+        @returns: the augmenter that horizontally flips a video
+        """
+        return af.VideoAugmenterByHFlip()
+
 
 class HStack(BaseTransform):
     def __init__(
@@ -1038,6 +1268,12 @@ class Loop(BaseTransform):
         """
         return F.loop(video_path, output_path, self.num_loops, metadata=metadata)
 
+    def get_augmenter(self) -> BaseFFMPEGAugmenter:
+        """
+        @returns: the augmenter that loops a video
+        """
+        return af.VideoAugmenterByLoops(int(self.num_loops))
+
 
 class Overlay(BaseTransform):
     def __init__(
@@ -1229,6 +1465,14 @@ class OverlayText(BaseTransform):
             metadata=metadata,
         )
 
+    def get_augmenter(self) -> BaseFFMPEGAugmenter:
+        """
+        @returns: the augmenter that overlays text onto a video
+        """
+        return af.VideoAugmenterByText(
+            self.font, float(self.fontsize), int(self.num_lines), float(self.opacity)
+        )
+
 
 class Pad(BaseTransform):
     def __init__(
@@ -1280,6 +1524,16 @@ class Pad(BaseTransform):
             metadata=metadata,
         )
 
+    def get_augmenter(self) -> BaseFFMPEGAugmenter:
+        """
+        @returns: the augmenter that pads a video
+        """
+        return af.VideoAugmenterByPadding(
+            float(self.w_factor),
+            float(self.h_factor),
+            tuple(map(int, self.color)),
+        )
+
 
 class Pixelization(BaseTransform):
     def __init__(self, ratio: float = 1.0, p: float = 1.0):
@@ -1359,6 +1613,12 @@ class RandomFrames(BaseTransform):
             metadata=metadata,
         )
 
+    def get_augmenter(self) -> BaseFFMPEGAugmenter:
+        """
+        @returns: the augmenter that shuffles frames of a video
+        """
+        return af.VideoAugmenterByRandomFrames(int(self.num_frames))
+
 
 class RemoveAudio(BaseTransform):
     def apply_transform(
@@ -1386,7 +1646,11 @@ class RemoveAudio(BaseTransform):
 
 class Resize(BaseTransform):
     def __init__(
-        self, width: Optional[int] = None, height: Optional[int] = None, p: float = 1.0
+        self,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        flags: str = "bicubic",
+        p: float = 1.0,
     ):
         """
         @param width: the width in which the video should be resized to. If None, the
@@ -1395,10 +1659,15 @@ class Resize(BaseTransform):
         @param height: the height in which the video should be resized to. If None,
             the original video height will be used
 
+        @param flags: the scaling algorithm. "fast_bilinear" is several times
+            faster than the default "bicubic", which suits training data where
+            subpixel quality doesn't matter
+
         @param p: the probability of the transform being applied; default value is 1.0
         """
         super().__init__(p)
         self.width, self.height = width, height
+        self.flags = flags
 
     def apply_transform(
         self,
@@ -1421,7 +1690,22 @@ class Resize(BaseTransform):
         @returns: the path to the augmented video
         """
         return F.resize(
-            video_path, output_path, self.width, self.height, metadata=metadata
+            video_path,
+            output_path,
+            self.width,
+            self.height,
+            self.flags,
+            metadata=metadata,
+        )
+
+    def get_augmenter(self) -> BaseFFMPEGAugmenter:
+        """
+        @returns: the augmenter that resizes a video
+        """
+        return af.VideoAugmenterByResize(
+            None if self.width is None else int(self.width),
+            None if self.height is None else int(self.height),
+            self.flags,
         )
 
 
@@ -1458,6 +1742,12 @@ class Rotate(BaseTransform):
         """
         return F.rotate(video_path, output_path, self.degrees, metadata=metadata)
 
+    def get_augmenter(self) -> BaseFFMPEGAugmenter:
+        """
+        @returns: the augmenter that rotates a video
+        """
+        return af.VideoAugmenterByRotation(float(self.degrees))
+
 
 class Scale(BaseTransform):
     def __init__(self, factor: float = 0.5, p: float = 1.0):
@@ -1491,6 +1781,12 @@ class Scale(BaseTransform):
         """
         return F.scale(video_path, output_path, self.factor, metadata=metadata)
 
+    def get_augmenter(self) -> BaseFFMPEGAugmenter:
+        """
+        @returns: the augmenter that alters the resolution of a video
+        """
+        return af.VideoAugmenterByResolution(float(self.factor))
+
 
 class Transpose(BaseTransform):
     def __init__(self, direction: int = 0, p: float = 1.0):
@@ -1528,10 +1824,20 @@ class Transpose(BaseTransform):
         """
         return F.transpose(video_path, output_path, self.direction, metadata=metadata)
 
+    def get_augmenter(self) -> BaseFFMPEGAugmenter:
+        """
+        @returns: the augmenter that transposes a video
+        """
+        return af.VideoAugmenterByTransposition(int(self.direction))
+
 
 class Trim(BaseTransform):
     def __init__(
-        self, start: Optional[float] = None, end: Optional[float] = None, p: float = 1.0
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        fast: bool = False,
+        p: float = 1.0,
     ):
         """
         @param start: starting point in seconds of when the trimmed video should start.
@@ -1540,10 +1846,15 @@ class Trim(BaseTransform):
         @param end: ending point in seconds of when the trimmed video should end.
             If None, the end will be the duration of the video
 
+        @param fast: if set to True, videos with even dimensions are cut without
+            re-encoding, so the cut starts on the keyframe before `start` rather
+            than exactly at it
+
         @param p: the probability of the transform being applied; default value is 1.0
         """
         super().__init__(p)
         self.start, self.end = start, end
+        self.fast = fast
 
     def apply_transform(
         self,
@@ -1565,7 +1876,9 @@ class Trim(BaseTransform):
 
         @returns: the path to the augmented video
         """
-        return F.trim(video_path, output_path, self.start, self.end, metadata=metadata)
+        return F.trim(
+            video_path, output_path, self.start, self.end, self.fast, metadata=metadata
+        )
 
 
 class VFlip(BaseTransform):
@@ -1591,6 +1904,12 @@ class VFlip(BaseTransform):
         """
         return F.vflip(video_path, output_path, metadata=metadata)
 
+    def get_augmenter(self) -> BaseFFMPEGAugmenter:
+        """
+        @returns: the augmenter that vertically flips a video
+        """
+        return af.VideoAugmenterByVFlip()
+
 
 class VStack(BaseTransform):
     def __init__(